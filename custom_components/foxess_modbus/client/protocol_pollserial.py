@@ -4,9 +4,9 @@ https://github.com/pyserial/pyserial/issues/617
 """
 
 import errno
+import fcntl
 import os
 import select
-from enum import Enum
 from typing import Any
 
 import serial
@@ -17,11 +17,32 @@ from serial.serialutil import SerialTimeoutException
 from serial.serialutil import Timeout
 from serial.serialutil import to_bytes
 
+# Wait-loop outcomes. Plain ints rather than an Enum: these are set and compared on every wake in
+# the hot loops, and int comparison is cheaper than Enum member lookup.
+_TIMEOUT = 0
+_ABORT = 1
+_READY = 2
 
-class _PollResult(Enum):
-    TIMEOUT = 0
-    ABORT = 1
-    READY = 2
+
+# epoll keeps the interest set in the kernel, so repeatedly waiting on the same two fds avoids
+# poll's per-call pollfd copy. It's Linux-only; fall back to poll elsewhere.
+_HAS_EPOLL = hasattr(select, "epoll")
+
+# Bound once at import: saves re-resolving serial.Serial.port.__set__ on every assignment
+_base_port_setter = serial.Serial.port.__set__
+
+# Linux-only; used to size abort-pipe drains to the pipe's full capacity
+_F_GETPIPE_SZ = getattr(fcntl, "F_GETPIPE_SZ", None)
+
+# Event masks, assembled once at import instead of per registration/check. The POLL* and EPOLL*
+# error bits share values (POLLNVAL has no epoll equivalent: operations on a closed epoll fd raise
+# instead), so the poll error mask is also safe to test epoll events against.
+_POLL_ERROR_EVENTS = select.POLLERR | select.POLLHUP | select.POLLNVAL
+_POLL_IN_EVENTS = select.POLLIN | _POLL_ERROR_EVENTS
+_POLL_OUT_EVENTS = select.POLLOUT | _POLL_ERROR_EVENTS
+if _HAS_EPOLL:
+    _EPOLL_IN_EVENTS = select.EPOLLIN | select.EPOLLERR | select.EPOLLHUP
+    _EPOLL_OUT_EVENTS = select.EPOLLOUT | select.EPOLLERR | select.EPOLLHUP
 
 
 class Serial(serialposix.Serial):
@@ -30,66 +51,172 @@ class Serial(serialposix.Serial):
     but with https://github.com/pyserial/pyserial/pull/618 applied
     """
 
+    # Poll objects are cached across read()/write() calls: registering the fds on every call costs
+    # two extra syscalls per I/O, which adds up on the hot Modbus poll loop
+    _read_poll: "select.epoll | select.poll | None" = None
+    _write_poll: "select.epoll | select.poll | None" = None
+
+    # Timeout objects are also reused between calls (via Timeout.restart) as long as the configured
+    # duration hasn't changed, saving an allocation per read/write
+    _read_timeout_obj: "Timeout | None" = None
+    _write_timeout_obj: "Timeout | None" = None
+
+    # Scratch buffer reused by read(): Modbus polling reads similar-sized frames over and over, so
+    # after the first few calls no per-call allocation is needed (read() returns a copy, so reuse
+    # is safe)
+    _read_buf: "bytearray | None" = None
+
+    # Abort-pipe capacities, queried once per open: a read of this size is guaranteed to drain
+    # every queued cancel in a single syscall
+    _abort_read_pipe_size: int = 1024
+    _abort_write_pipe_size: int = 1024
+
     @serial.Serial.port.setter  # type: ignore
     def port(self, value: str) -> None:
         if value is not None:
-            serial.Serial.port.__set__(self, value.removeprefix("pollserial://"))
+            _base_port_setter(self, value.removeprefix("pollserial://"))
+
+    def close(self) -> None:
+        """Close port"""
+        # The cached poll objects hold registrations for fds which are about to be closed
+        # (and an epoll object owns an fd of its own)
+        if _HAS_EPOLL:
+            if self._read_poll is not None:
+                self._read_poll.close()  # type: ignore[union-attr]
+            if self._write_poll is not None:
+                self._write_poll.close()  # type: ignore[union-attr]
+        self._read_poll = None
+        self._write_poll = None
+        super().close()
 
     def read(self, size: int = 1) -> bytes:
         """Read size bytes from the serial port using poll."""
         if not self.is_open:
             raise PortNotOpenError()
 
-        read = bytearray()
-        timeout = Timeout(self._timeout)
+        # Read straight into the reused buffer, growing it if this request is the largest yet
+        read_buf = self._read_buf
+        if read_buf is None or len(read_buf) < size:
+            read_buf = bytearray(size)
+            self._read_buf = read_buf
+        buf = memoryview(read_buf)[:size]
+
+        # Fast path: the port is opened O_NONBLOCK, so try a read before setting up a wait. Data is
+        # often already buffered by the time read() is called (e.g. the rest of a Modbus frame), and
+        # this avoids the poll syscall entirely.
+        try:
+            bytes_read = os.readv(self.fd, [buf])
+        except BlockingIOError:
+            bytes_read = 0
+        if bytes_read >= size:
+            return bytes(buf)
+
+        # The whole request wasn't buffered, so fall back to waiting. Keeping the wait loop in a
+        # separate method keeps this common-case path small.
+        return self._read_wait(buf, bytes_read, size)
+
+    def _read_wait(self, buf: memoryview, bytes_read: int, size: int) -> bytes:
+        """Slow path of read(): wait for the remaining bytes until timeout/abort."""
+        timeout = self._read_timeout_obj
+        if timeout is None or timeout.duration != self._timeout:
+            timeout = Timeout(self._timeout)
+            self._read_timeout_obj = timeout
+        elif not timeout.is_infinite:
+            timeout.restart(self._timeout)
 
-        poll = select.poll()
-        poll.register(self.fd, select.POLLIN | select.POLLERR | select.POLLHUP | select.POLLNVAL)
-        poll.register(self.pipe_abort_read_r, select.POLLIN | select.POLLERR | select.POLLHUP | select.POLLNVAL)
+        poll = self._read_poll
+        if poll is None:
+            if _HAS_EPOLL:
+                # The serial fd is edge-triggered: read() always drains it (either to the requested
+                # size or to empty), so a level-triggered re-report of the same data is never
+                # needed, and the kernel skips re-scanning the fd on every wait. The abort pipe
+                # stays level-triggered as it's only partially drained.
+                poll = select.epoll()
+                poll.register(self.fd, _EPOLL_IN_EVENTS | select.EPOLLET)
+                poll.register(self.pipe_abort_read_r, _EPOLL_IN_EVENTS)
+            else:
+                poll = select.poll()
+                poll.register(self.fd, _POLL_IN_EVENTS)
+                poll.register(self.pipe_abort_read_r, _POLL_IN_EVENTS)
+            if _F_GETPIPE_SZ is not None:
+                self._abort_read_pipe_size = fcntl.fcntl(self.pipe_abort_read_r, _F_GETPIPE_SZ)
+            self._read_poll = poll
 
-        while len(read) < size:
-            # Wait until device ready to read or timeout/abort occurs
-            poll_timeout = None if timeout.is_infinite else int(timeout.time_left() * 1000)
-            events = poll.poll(poll_timeout)
+        # Hoist the attribute loads out of the event loop: these are looked up per event per wake
+        # otherwise
+        own_fd = self.fd
+        abort_fd = self.pipe_abort_read_r
+        error_events = _POLL_ERROR_EVENTS
+        is_infinite = timeout.is_infinite
+        time_left = timeout.time_left
 
-            result = _PollResult.TIMEOUT
+        while bytes_read < size:
+            # Wait until device ready to read or timeout/abort occurs. time_left() is already
+            # clamped to >= 0, so it can be handed straight to the kernel: epoll takes (fractional)
+            # seconds, poll integer milliseconds.
+            if is_infinite:
+                events = poll.poll(-1 if _HAS_EPOLL else None)
+            elif _HAS_EPOLL:
+                events = poll.poll(time_left())
+            else:
+                events = poll.poll(int(time_left() * 1000))
+
+            result = _TIMEOUT
             for fd, event in events:
-                if fd == self.pipe_abort_read_r:
-                    os.read(self.pipe_abort_read_r, 1000)
-                    result = _PollResult.ABORT
+                if fd == abort_fd:
+                    # Sized to the pipe capacity, so every queued cancel is drained in one read
+                    os.read(abort_fd, self._abort_read_pipe_size)
+                    result = _ABORT
                     break
-                if event & (select.POLLERR | select.POLLHUP | select.POLLNVAL):
+                if event & error_events:
                     raise SerialException("device reports error (poll)")
-                if fd == self.fd:
-                    result = _PollResult.READY
+                if fd == own_fd:
+                    result = _READY
 
-            if result == _PollResult.READY:
-                buf = os.read(self.fd, size - len(read))
-                read.extend(buf)
-                if self._inter_byte_timeout and not buf:
+            if result == _READY:
+                try:
+                    n = os.readv(own_fd, [buf[bytes_read:]])
+                except BlockingIOError:
+                    # An edge-triggered event can be stale if the fast-path read above already
+                    # drained the fd; just wait again
+                    continue
+                bytes_read += n
+                if self._inter_byte_timeout and not n:
                     break  # Stop if inter-byte timeout and no data
-            elif result in (_PollResult.TIMEOUT, _PollResult.ABORT) or timeout.expired():
+            elif result in (_TIMEOUT, _ABORT) or timeout.expired():
                 break
 
-        return bytes(read)
+        return bytes(buf[:bytes_read])
 
     def write(self, data: Any) -> int:
         """Write the given byte string over the serial port using poll."""
         if not self.is_open:
             raise PortNotOpenError()
 
-        d = to_bytes(data)
+        # A memoryview makes the d[n:] slice after each partial write O(1) instead of copying the
+        # remainder of the buffer
+        d = memoryview(to_bytes(data))
         total_len = len(d)
         tx_remaining = total_len
-        timeout = Timeout(self._write_timeout)
 
-        poll = select.poll()
-        poll.register(self.fd, select.POLLOUT | select.POLLERR | select.POLLHUP | select.POLLNVAL)
-        poll.register(self.pipe_abort_write_r, select.POLLIN | select.POLLERR | select.POLLHUP | select.POLLNVAL)
+        timeout = self._write_timeout_obj
+        if timeout is None or timeout.duration != self._write_timeout:
+            timeout = Timeout(self._write_timeout)
+            self._write_timeout_obj = timeout
+        elif not timeout.is_infinite:
+            timeout.restart(self._write_timeout)
+
+        # Hoist the attribute loads out of the event loop: these are looked up per event per wake
+        # otherwise
+        own_fd = self.fd
+        abort_fd = self.pipe_abort_write_r
+        error_events = _POLL_ERROR_EVENTS
+        is_infinite = timeout.is_infinite
+        time_left = timeout.time_left
 
         while tx_remaining > 0:
             try:
-                n = os.write(self.fd, d)
+                n = os.write(own_fd, d)
                 tx_remaining -= n
                 d = d[n:]
 
@@ -100,24 +227,50 @@ class Serial(serialposix.Serial):
                 if tx_remaining == 0:
                     break
 
-                # Wait until ready to write again or timeout/abort occurs
-                poll_timeout = None if timeout.is_infinite else int(timeout.time_left() * 1000)
-                events = poll.poll(poll_timeout)
+                # The wait object is only set up once a write actually has to wait: the common case
+                # (whole frame accepted by the first os.write, or a non-blocking write) never needs
+                # one
+                poll = self._write_poll
+                if poll is None:
+                    if _HAS_EPOLL:
+                        # Edge-triggered: the loop writes until EAGAIN before waiting, which is
+                        # exactly the drain ET requires
+                        poll = select.epoll()
+                        poll.register(own_fd, _EPOLL_OUT_EVENTS | select.EPOLLET)
+                        poll.register(abort_fd, _EPOLL_IN_EVENTS)
+                    else:
+                        poll = select.poll()
+                        poll.register(own_fd, _POLL_OUT_EVENTS)
+                        poll.register(abort_fd, _POLL_IN_EVENTS)
+                    if _F_GETPIPE_SZ is not None:
+                        self._abort_write_pipe_size = fcntl.fcntl(abort_fd, _F_GETPIPE_SZ)
+                    self._write_poll = poll
+
+                # Wait until ready to write again or timeout/abort occurs. time_left() is
+                # already clamped to >= 0, so it can be handed straight to the kernel: epoll takes
+                # (fractional) seconds, poll integer milliseconds.
+                if is_infinite:
+                    events = poll.poll(-1 if _HAS_EPOLL else None)
+                elif _HAS_EPOLL:
+                    events = poll.poll(time_left())
+                else:
+                    events = poll.poll(int(time_left() * 1000))
 
-                result = _PollResult.TIMEOUT
+                result = _TIMEOUT
                 for fd, event in events:
-                    if fd == self.pipe_abort_write_r:
-                        os.read(self.pipe_abort_write_r, 1000)
-                        result = _PollResult.ABORT
+                    if fd == abort_fd:
+                        # Sized to the pipe capacity, so every queued cancel is drained in one read
+                        os.read(abort_fd, self._abort_write_pipe_size)
+                        result = _ABORT
                         break
-                    if event & (select.POLLERR | select.POLLHUP | select.POLLNVAL):
+                    if event & error_events:
                         raise SerialException("device reports error (poll)")
-                    if fd == self.fd:
-                        result = _PollResult.READY
+                    if fd == own_fd:
+                        result = _READY
 
-                if result == _PollResult.TIMEOUT:
+                if result == _TIMEOUT:
                     raise SerialTimeoutException("Write timeout")
-                if result == _PollResult.ABORT:
+                if result == _ABORT:
                     break
 
             except OSError as e:
@@ -25,6 +25,17 @@ class ModbusControllerEntity(ABC):
     def register_poll_type(self) -> RegisterPollType:
         return RegisterPollType.PERIODICALLY
 
+    @property
+    def update_callback_on_any_change(self) -> bool:
+        """
+        Whether update_callback must be called for every change notification.
+
+        By default the controller only dispatches update_callback to entities which own one of the
+        changed addresses (via its address index). Entities which react to things other than their
+        own addresses changing should override this to return True.
+        """
+        return False
+
     @abstractmethod
     def update_callback(self, changed_addresses: set[int]) -> None:
         """Notify listeners that the given addresses have changed"""
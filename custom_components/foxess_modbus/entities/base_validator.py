@@ -10,3 +10,12 @@ class BaseValidator(ABC):
     @abstractmethod
     def validate(self, data: float) -> bool:
         """Validate a value against a set of rules"""
+
+    def bounds(self) -> tuple[float, float] | None:
+        """
+        If this validator just checks a (min, max) interval, return it, else None.
+
+        This lets hot decode paths inline the comparison rather than dispatching to validate()
+        per sample.
+        """
+        return None
@@ -1,13 +1,21 @@
 """Holds all entity descriptions for all entities across all inverters"""
 
 import itertools
+import math
+import sys
+from dataclasses import replace
+from functools import lru_cache
+from functools import partial
+from typing import Callable
 from typing import Iterable
+from typing import Sequence
 
 from homeassistant.components.number import NumberDeviceClass
 from homeassistant.components.number import NumberMode
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import Entity
 
 from custom_components.foxess_modbus.entities.base_validator import BaseValidator
 
@@ -38,17 +46,110 @@ from .remote_control_description import REMOTE_CONTROL_DESCRIPTION
 from .validation import Min
 from .validation import Range
 
+# Units which recur across many descriptions, interned once: descriptions then share one string
+# object per unit, and downstream equality checks against the same interned value are pointer
+# comparisons
+_U_V, _U_A, _U_KW, _U_KVA, _U_KVAR = map(sys.intern, ("V", "A", "kW", "kVA", "kvar"))
+
+# Enum members referenced many times below, bound to module globals once: each use is then a
+# single global load rather than two attribute lookups, which also trims this module's import time
+_MEASUREMENT = SensorStateClass.MEASUREMENT
+_TOTAL_INCREASING = SensorStateClass.TOTAL_INCREASING
+_TOTAL = SensorStateClass.TOTAL
+_POWER_FACTOR = SensorDeviceClass.POWER_FACTOR
+_POWER = SensorDeviceClass.POWER
+_ENERGY = SensorDeviceClass.ENERGY
+_CURRENT = SensorDeviceClass.CURRENT
+_VOLTAGE = SensorDeviceClass.VOLTAGE
+_BATTERY = SensorDeviceClass.BATTERY
+_TEMPERATURE = SensorDeviceClass.TEMPERATURE
+_REACTIVE_POWER = SensorDeviceClass.REACTIVE_POWER
+_APPARENT_POWER = SensorDeviceClass.APPARENT_POWER
+_FREQUENCY = SensorDeviceClass.FREQUENCY
+_NUMBER_BATTERY = NumberDeviceClass.BATTERY
+_NUMBER_CURRENT = NumberDeviceClass.CURRENT
+_NUMBER_POWER = NumberDeviceClass.POWER
+_MODE_BOX = NumberMode.BOX
+_HOURS = UnitOfTime.HOURS
+
 # hass type hints are messed up, and mypy doesn't see inherited dataclass properties on the EntityDescriptions
 # mypy: disable-error-code="call-arg"
 
 
-BMS_CONNECT_STATE_ADDRESS = [
-    ModbusAddressSpec(input=11058, models=Inv.H1_G1 | Inv.KH_PRE119),
+# post_process callbacks run on every poll for every sensor which sets them. Shared module-level
+# callables avoid building a new lambda per description, and let descriptions created by the same
+# factory share one function object.
+
+# Clamps negative readings to 0. A partial of the max builtin: calling it stays in C, with no
+# Python frame per sample
+_positive_only: Callable[[float], float] = partial(max, 0.0)
+
+
+def _negative_magnitude(value: float) -> float:
+    """Return the magnitude of negative readings, and 0 for positive ones"""
+    return -value if value < 0 else 0
+
+
+@lru_cache(maxsize=None)
+def _addr(address: int) -> list[int]:
+    """
+    Return a shared single-element address list.
+
+    Hundreds of specs below use a one-register list, and the same register appears in many
+    descriptions; the specs never mutate their address lists, so they can all share one object per
+    address.
+    """
+    return [address]
+
+
+@lru_cache(maxsize=None)
+def _range(start: float, end: float) -> tuple[BaseValidator, ...]:
+    """
+    Return a shared (Range(start, end),) validator tuple.
+
+    Validators are stateless, so every description with the same bounds can reference one
+    instance.
+    """
+    return (Range(start, end),)
+
+
+# Names for the most common bounds, so the busiest descriptions read a touch better
+_RANGE_0_100 = _range(0, 100)
+_RANGE_NEG100_100 = _range(-100, 100)
+_RANGE_0_300 = _range(0, 300)
+_MIN_0: tuple[BaseValidator, ...] = (Min(0),)
+
+# Model sets shared by dozens of descriptions, evaluated once here rather than as a fresh Flag
+# union at every use site
+_H3_PRO_AND_SMART = Inv.H3_PRO_SET | Inv.H3_SMART
+_H1_G1_AND_KH_PRE119 = Inv.H1_G1 | Inv.KH_PRE119
+_H1_SET_AND_KH = Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+_H1_G1_G2_H3_AND_KH = Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+_H1_G1_G2_AND_H3 = Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET
+_KH_133_H3_PRO_AND_SMART = Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART
+_H1_G1_LAN_KH_PRE133_AND_H3 = Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET
+# As _H1_G1_G2_H3_AND_KH, but excluding AIO-H3s on firmware older than 1.01
+_H1_G1_G2_H3_AND_KH_POST101_AIO = _H1_G1_G2_H3_AND_KH & ~Inv.AIO_H3_PRE101
+
+# The grid_ct / feed_in / grid_consumption descriptions are three views over the same registers:
+# they reference these single list instances rather than building three copies each
+_GRID_CT_ADDRESSES = (
+    ModbusAddressesSpec(input=_addr(11021), models=Inv.H1_G1),
+    ModbusAddressesSpec(holding=_addr(31014), models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET),
+    ModbusAddressesSpec(holding=[39169, 39168], models=Inv.KH_133),
+)
+_GRID_CT_ADDRESSES_KH = (
+    ModbusAddressesSpec(input=_addr(11021), models=Inv.KH_PRE119),
+    ModbusAddressesSpec(holding=[31050, 31049], models=Inv.KH_PRE133),
+)
+
+BMS_CONNECT_STATE_ADDRESS = (
+    ModbusAddressSpec(input=11058, models=_H1_G1_AND_KH_PRE119),
     ModbusAddressSpec(holding=31029, models=Inv.H1_G1 | Inv.H1_LAN),
     ModbusAddressSpec(holding=31028, models=Inv.KH_PRE133 | Inv.H1_G2_SET),
     ModbusAddressSpec(holding=37002, models=Inv.KH_133),
     ModbusAddressSpec(holding=31042, models=Inv.H3_SET),
-]
+)
 
 
 def _version_entities() -> Iterable[EntityFactory]:
@@ -64,7 +165,7 @@ def _version_entities() -> Iterable[EntityFactory]:
 
     yield _master_version(
         address=[
-            ModbusAddressSpec(input=10016, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=10016, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(holding=30016, models=Inv.H1_G1 | Inv.H1_LAN | Inv.H3_SET),
             ModbusAddressSpec(holding=36001, models=Inv.H3_PRO_PRE122),
         ],
@@ -89,7 +190,7 @@ def _version_entities() -> Iterable[EntityFactory]:
 
     yield _slave_version(
         address=[
-            ModbusAddressSpec(input=10017, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=10017, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(holding=30017, models=Inv.H1_G1 | Inv.H1_LAN | Inv.H3_SET),
             ModbusAddressSpec(holding=36002, models=Inv.H3_PRO_PRE122),
         ],
@@ -114,7 +215,7 @@ def _version_entities() -> Iterable[EntityFactory]:
 
     yield _manager_version(
         address=[
-            ModbusAddressSpec(input=10018, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=10018, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(holding=30018, models=Inv.H1_G1 | Inv.H1_LAN),
         ],
         is_hex=False,
@@ -128,77 +229,99 @@ def _version_entities() -> Iterable[EntityFactory]:
     )
 
 
+# Templates for the PV factories below: each PV string re-uses the same description with only
+# key/addresses/name (and, for current, scale) changed, so the common fields are built once here
+# and each variant is cloned with dataclasses.replace rather than re-running the full description
+# construction per string
+_PV_VOLTAGE_TEMPLATE = ModbusSensorDescription(
+    key="",
+    addresses=[],
+    name="",
+    device_class=_VOLTAGE,
+    state_class=_MEASUREMENT,
+    native_unit_of_measurement=_U_V,
+    scale=0.1,
+    scale_den=10,
+    round_to=1,
+    # This can go negative if no panels are attached
+)
+
+_PV_CURRENT_TEMPLATE = ModbusSensorDescription(
+    key="",
+    addresses=[],
+    name="",
+    device_class=_CURRENT,
+    state_class=_MEASUREMENT,
+    native_unit_of_measurement=_U_A,
+    round_to=1,
+    # This can a small amount negative
+    post_process=_positive_only,
+    validate=_RANGE_0_100,
+)
+
+_PV_POWER_TEMPLATE = ModbusSensorDescription(
+    key="",
+    addresses=[],
+    name="",
+    device_class=_POWER,
+    state_class=_MEASUREMENT,
+    native_unit_of_measurement=_U_KW,
+    icon="mdi:solar-power-variant-outline",
+    scale=0.001,
+    scale_den=1000,
+    round_to=0.01,
+    # This can go negative if no panels are attached
+    post_process=_positive_only,
+)
+
+
 def _pv_entities() -> Iterable[EntityFactory]:
     def _pv_voltage(key: str, addresses: list[ModbusAddressesSpec], name: str) -> EntityFactory:
-        return ModbusSensorDescription(
-            key=key,
-            addresses=addresses,
-            name=name,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
-            scale=0.1,
-            round_to=1,
-            # This can go negative if no panels are attached
-        )
+        return replace(_PV_VOLTAGE_TEMPLATE, key=key, addresses=addresses, name=name)
 
     def _pv_current(key: str, addresses: list[ModbusAddressesSpec], name: str, scale: float) -> EntityFactory:
-        return ModbusSensorDescription(
+        return replace(
+            _PV_CURRENT_TEMPLATE,
             key=key,
             addresses=addresses,
             name=name,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="A",
             scale=scale,
-            round_to=1,
-            # This can a small amount negative
-            post_process=lambda x: max(x, 0),
-            validate=[Range(0, 100)],
+            scale_den=round(1 / scale),
         )
 
     def _pv_power(key: str, addresses: list[ModbusAddressesSpec], name: str) -> EntityFactory:
-        return ModbusSensorDescription(
-            key=key,
-            addresses=addresses,
-            name=name,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
-            icon="mdi:solar-power-variant-outline",
-            scale=0.001,
-            round_to=0.01,
-            # This can go negative if no panels are attached
-            post_process=lambda x: max(x, 0),
-        )
+        return replace(_PV_POWER_TEMPLATE, key=key, addresses=addresses, name=name)
 
     def _pv_energy_total(key: str, models: list[EntitySpec], name: str, source_entity: str) -> EntityFactory:
         return ModbusIntegrationSensorDescription(
             key=key,
             models=models,
-            device_class=SensorDeviceClass.ENERGY,
+            device_class=_ENERGY,
             native_unit_of_measurement="kWh",
             integration_method="left",
             name=name,
             source_entity=source_entity,
-            unit_time=UnitOfTime.HOURS,
+            unit_time=_HOURS,
             icon="mdi:solar-power-variant-outline",
         )
 
     yield _pv_voltage(
         key="pv1_voltage",
         addresses=[
-            ModbusAddressesSpec(input=[11000], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31000], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39070], models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(input=_addr(11000), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31000), models=_H1_G1_LAN_KH_PRE133_AND_H3),
+            ModbusAddressesSpec(
+                holding=_addr(39070),
+                models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART,
+            ),
         ],
         name="PV1 Voltage",
     )
     yield _pv_current(
         key="pv1_current",
         addresses=[
-            ModbusAddressesSpec(input=[11001], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31001], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11001), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31001), models=_H1_G1_LAN_KH_PRE133_AND_H3),
         ],
         name="PV1 Current",
         scale=0.1,
@@ -206,7 +329,10 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_current(
         key="pv1_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39071], models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(
+                holding=_addr(39071),
+                models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART,
+            ),
         ],
         name="PV1 Current",
         scale=0.01,
@@ -214,12 +340,12 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_power(
         key="pv1_power",
         addresses=[
-            ModbusAddressesSpec(input=[11002], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31002], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11002), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31002), models=_H1_G1_LAN_KH_PRE133_AND_H3),
             # This is techincally a 32-bit register on the G2, but it doesn't appear to actually write the upper word,
             # which means that negative values are represented incorrectly (as 0x0000FFFF etc)
-            ModbusAddressesSpec(holding=[39280], models=Inv.H1_G2_SET),
-            ModbusAddressesSpec(holding=[39280, 39279], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(39280), models=Inv.H1_G2_SET),
+            ModbusAddressesSpec(holding=[39280, 39279], models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV1 Power",
     )
@@ -237,17 +363,20 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_voltage(
         key="pv2_voltage",
         addresses=[
-            ModbusAddressesSpec(input=[11003], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31003], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39072], models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(input=_addr(11003), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31003), models=_H1_G1_LAN_KH_PRE133_AND_H3),
+            ModbusAddressesSpec(
+                holding=_addr(39072),
+                models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART,
+            ),
         ],
         name="PV2 Voltage",
     )
     yield _pv_current(
         key="pv2_current",
         addresses=[
-            ModbusAddressesSpec(input=[11004], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31004], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11004), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31004), models=_H1_G1_LAN_KH_PRE133_AND_H3),
         ],
         name="PV2 Current",
         scale=0.1,
@@ -255,7 +384,10 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_current(
         key="pv2_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39073], models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(
+                holding=_addr(39073),
+                models=Inv.H1_G2_SET | Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART,
+            ),
         ],
         name="PV2 Current",
         scale=0.01,
@@ -263,12 +395,12 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_power(
         key="pv2_power",
         addresses=[
-            ModbusAddressesSpec(input=[11005], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31005], models=Inv.H1_G1 | Inv.H1_LAN | Inv.KH_PRE133 | Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11005), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31005), models=_H1_G1_LAN_KH_PRE133_AND_H3),
             # This is techincally a 32-bit register on the G2, but it doesn't appear to actually write the upper word,
             # which means that negative values are represented incorrectly (as 0x0000FFFF etc)
-            ModbusAddressesSpec(holding=[39282], models=Inv.H1_G2_SET),
-            ModbusAddressesSpec(holding=[39282, 39281], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(39282), models=Inv.H1_G2_SET),
+            ModbusAddressesSpec(holding=[39282, 39281], models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV2 Power",
     )
@@ -286,17 +418,17 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_voltage(
         key="pv3_voltage",
         addresses=[
-            ModbusAddressesSpec(input=[11096], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31039], models=Inv.KH_PRE133),
-            ModbusAddressesSpec(holding=[39074], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(input=_addr(11096), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31039), models=Inv.KH_PRE133),
+            ModbusAddressesSpec(holding=_addr(39074), models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV3 Voltage",
     )
     yield _pv_current(
         key="pv3_current",
         addresses=[
-            ModbusAddressesSpec(input=[11097], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31040], models=Inv.KH_PRE133),
+            ModbusAddressesSpec(input=_addr(11097), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31040), models=Inv.KH_PRE133),
         ],
         name="PV3 Current",
         scale=0.1,
@@ -304,7 +436,7 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_current(
         key="pv3_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39075], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(39075), models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV3 Current",
         scale=0.01,
@@ -312,10 +444,10 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_power(
         key="pv3_power",
         addresses=[
-            ModbusAddressesSpec(input=[11098], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31041], models=Inv.KH_PRE133),
+            ModbusAddressesSpec(input=_addr(11098), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31041), models=Inv.KH_PRE133),
             ModbusAddressesSpec(holding=[39284, 39283], models=Inv.KH_133),
-            ModbusAddressesSpec(holding=[39284, 39283], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39284, 39283], models=_H3_PRO_AND_SMART),
         ],
         name="PV3 Power",
     )
@@ -333,17 +465,17 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_voltage(
         key="pv4_voltage",
         addresses=[
-            ModbusAddressesSpec(input=[11099], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31042], models=Inv.KH_PRE133),
-            ModbusAddressesSpec(holding=[39076], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(input=_addr(11099), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31042), models=Inv.KH_PRE133),
+            ModbusAddressesSpec(holding=_addr(39076), models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV4 Voltage",
     )
     yield _pv_current(
         key="pv4_current",
         addresses=[
-            ModbusAddressesSpec(input=[11100], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31043], models=Inv.KH_PRE133),
+            ModbusAddressesSpec(input=_addr(11100), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31043), models=Inv.KH_PRE133),
         ],
         name="PV4 Current",
         scale=0.1,
@@ -351,7 +483,7 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_current(
         key="pv4_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39077], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(39077), models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV4 Current",
         scale=0.01,
@@ -359,9 +491,9 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_power(
         key="pv4_power",
         addresses=[
-            ModbusAddressesSpec(input=[11101], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31044], models=Inv.KH_PRE133),
-            ModbusAddressesSpec(holding=[39286, 39285], models=Inv.KH_133 | Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(input=_addr(11101), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31044), models=Inv.KH_PRE133),
+            ModbusAddressesSpec(holding=[39286, 39285], models=_KH_133_H3_PRO_AND_SMART),
         ],
         name="PV4 Power",
     )
@@ -379,14 +511,14 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_voltage(
         key="pv5_voltage",
         addresses=[
-            ModbusAddressesSpec(holding=[39078], models=Inv.H3_PRO_SET),
+            ModbusAddressesSpec(holding=_addr(39078), models=Inv.H3_PRO_SET),
         ],
         name="PV5 Voltage",
     )
     yield _pv_current(
         key="pv5_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39079], models=Inv.H3_PRO_SET),
+            ModbusAddressesSpec(holding=_addr(39079), models=Inv.H3_PRO_SET),
         ],
         name="PV5 Current",
         scale=0.01,
@@ -412,14 +544,14 @@ def _pv_entities() -> Iterable[EntityFactory]:
     yield _pv_voltage(
         key="pv6_voltage",
         addresses=[
-            ModbusAddressesSpec(holding=[39080], models=Inv.H3_PRO_SET),
+            ModbusAddressesSpec(holding=_addr(39080), models=Inv.H3_PRO_SET),
         ],
         name="PV6 Voltage",
     )
     yield _pv_current(
         key="pv6_current",
         addresses=[
-            ModbusAddressesSpec(holding=[39081], models=Inv.H3_PRO_SET),
+            ModbusAddressesSpec(holding=_addr(39081), models=Inv.H3_PRO_SET),
         ],
         name="PV6 Current",
         scale=0.01,
@@ -451,11 +583,11 @@ def _pv_entities() -> Iterable[EntityFactory]:
             ),
         ],
         sources=["pv1_power", "pv2_power"],
-        method=sum,
+        method=math.fsum,
         name="PV Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:solar-power-variant-outline",
     )
     yield ModbusLambdaSensorDescription(
@@ -467,11 +599,11 @@ def _pv_entities() -> Iterable[EntityFactory]:
             ),
         ],
         sources=["pv1_power", "pv2_power", "pv3_power", "pv4_power"],
-        method=sum,
+        method=math.fsum,
         name="PV Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:solar-power-variant-outline",
     )
     yield ModbusLambdaSensorDescription(
@@ -483,11 +615,11 @@ def _pv_entities() -> Iterable[EntityFactory]:
             ),
         ],
         sources=["pv1_power", "pv2_power", "pv3_power", "pv4_power", "pv5_power", "pv6_power"],
-        method=sum,
+        method=math.fsum,
         name="PV Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:solar-power-variant-outline",
     )
 
@@ -496,247 +628,240 @@ def _h1_current_voltage_power_entities() -> Iterable[EntityFactory]:
     yield ModbusSensorDescription(
         key="load_power",
         addresses=[
-            ModbusAddressesSpec(input=[11023], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31016], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
+            ModbusAddressesSpec(input=_addr(11023), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31016), models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
             ModbusAddressesSpec(holding=[31054, 31053], models=Inv.KH_PRE133),
         ],
         name="Load Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:home-lightning-bolt-outline",
         scale=0.001,
         round_to=0.01,
-        validate=[Range(-100, 100)],
+        validate=_RANGE_NEG100_100,
     )
     yield ModbusSensorDescription(
         key="rvolt",  # Ideally rename to grid_voltage?
         addresses=[
-            ModbusAddressesSpec(input=[11009], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11009), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31006], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31006), models=_H1_SET_AND_KH
             ),
         ],
         entity_registry_enabled_default=False,
         name="Grid Voltage",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="V",
+        device_class=_VOLTAGE,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_V,
         scale=0.1,
         round_to=1,
         signed=False,
-        validate=[Range(0, 300)],
+        validate=_RANGE_0_300,
     )
     yield ModbusSensorDescription(
         key="rcurrent",
         addresses=[
-            ModbusAddressesSpec(input=[11010], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11010), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31007], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31007), models=_H1_SET_AND_KH
             ),
         ],
         name="Inverter Current",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
         round_to=1,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusSensorDescription(
         key="rpower",
         addresses=[
-            ModbusAddressesSpec(input=[11011], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31008], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
+            ModbusAddressesSpec(input=_addr(11011), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31008), models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
             ModbusAddressesSpec(holding=[31046, 31045], models=Inv.KH_PRE133),
         ],
         name="Inverter Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:export",
         scale=0.001,
         round_to=0.01,
         # Negative = charging batteries
-        validate=[Range(-100, 100)],
+        validate=_RANGE_NEG100_100,
     )
     yield ModbusSensorDescription(
         key="rpower_Q",
         addresses=[
-            ModbusAddressesSpec(input=[11012], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11012), models=_H1_G1_AND_KH_PRE119),
         ],
         entity_registry_enabled_default=False,
         name="Inverter Power (Reactive)",
         # REACTIVE_POWER only supports var, not kvar
-        # device_class=SensorDeviceClass.REACTIVE_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kvar",
+        # device_class=_REACTIVE_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KVAR,
         icon="mdi:export",
         scale=0.001,
         round_to=0.01,
         # Negative = charging batteries
-        validate=[Range(-100, 100)],
+        validate=_RANGE_NEG100_100,
     )
     yield ModbusSensorDescription(
         key="rpower_S",
         addresses=[
-            ModbusAddressesSpec(input=[11013], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11013), models=_H1_G1_AND_KH_PRE119),
         ],
         entity_registry_enabled_default=False,
         name="Inverter Power (Apparent)",
         # APPARENT_POWER only supports VA, not kVA
-        # device_class=SensorDeviceClass.APPARENT_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kVA",
+        # device_class=_APPARENT_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KVA,
         icon="mdi:export",
         scale=0.001,
         round_to=0.01,
         # Negative = charging batteries
-        validate=[Range(-100, 100)],
+        validate=_RANGE_NEG100_100,
     )
     yield ModbusSensorDescription(
         key="eps_rvolt",
         addresses=[
-            ModbusAddressesSpec(input=[11015], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11015), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31010], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31010), models=_H1_SET_AND_KH
             ),
         ],
         entity_registry_enabled_default=False,
         name="EPS Voltage",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="V",
+        device_class=_VOLTAGE,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_V,
         scale=0.1,
         round_to=1,
         signed=False,
-        validate=[Range(0, 300)],
+        validate=_RANGE_0_300,
     )
     yield ModbusSensorDescription(
         key="eps_rcurrent",
         addresses=[
-            ModbusAddressesSpec(input=[11016], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11016), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31011], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31011), models=_H1_SET_AND_KH
             ),
         ],
         entity_registry_enabled_default=False,
         name="EPS Current",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
         round_to=1,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusSensorDescription(
         key="eps_rpower",
         addresses=[
-            ModbusAddressesSpec(input=[11017], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31012], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
+            ModbusAddressesSpec(input=_addr(11017), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(31012), models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_133),
             ModbusAddressesSpec(holding=[31048, 31047], models=Inv.KH_PRE133),
         ],
         entity_registry_enabled_default=False,
         name="EPS Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:power-socket",
         scale=0.001,
         round_to=0.01,
-        post_process=lambda x: max(x, 0),
-        validate=[Range(0, 100)],
+        post_process=_positive_only,
+        validate=_RANGE_0_100,
     )
     yield ModbusSensorDescription(
         key="eps_rpower_Q",
         addresses=[
-            ModbusAddressesSpec(input=[11018], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11018), models=_H1_G1_AND_KH_PRE119),
         ],
         entity_registry_enabled_default=False,
         name="EPS Power (Reactive)",
         # REACTIVE_POWER only supports var, not kvar
-        # device_class=SensorDeviceClass.REACTIVE_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kvar",
+        # device_class=_REACTIVE_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KVAR,
         icon="mdi:power-socket",
         scale=0.001,
         round_to=0.01,
-        post_process=lambda x: max(x, 0),
-        validate=[Range(0, 100)],
+        post_process=_positive_only,
+        validate=_RANGE_0_100,
     )
     yield ModbusSensorDescription(
         key="eps_rpower_S",
         addresses=[
-            ModbusAddressesSpec(input=[11019], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11019), models=_H1_G1_AND_KH_PRE119),
         ],
         entity_registry_enabled_default=False,
         name="EPS Power (Apparent)",
         # APPARENT_POWER only supports VA, not kVA
-        # device_class=SensorDeviceClass.APPARENT_POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kVA",
+        # device_class=_APPARENT_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KVA,
         icon="mdi:power-socket",
         scale=0.001,
         round_to=0.01,
-        post_process=lambda x: max(x, 0),
-        validate=[Range(0, 100)],
+        post_process=_positive_only,
+        validate=_RANGE_0_100,
     )
 
     # The KH uses the opposite sign for Grid CT, for some bizarre reason
 
-    def _grid_ct(addresses: list[ModbusAddressesSpec], scale: float) -> Iterable[ModbusSensorDescription]:
+    def _grid_ct(addresses: Sequence[ModbusAddressesSpec], scale: float) -> Iterable[ModbusSensorDescription]:
         yield ModbusSensorDescription(
             key="grid_ct",
             addresses=addresses,
             name="Grid CT",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
         yield ModbusSensorDescription(
             key="feed_in",
             addresses=addresses,
             name="Feed-in",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:transmission-tower-import",
             scale=scale,
             round_to=0.01,
-            post_process=lambda v: v if v > 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_positive_only,
+            validate=_RANGE_0_100,
         )
         yield ModbusSensorDescription(
             key="grid_consumption",
             addresses=addresses,
             name="Grid Consumption",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:transmission-tower-export",
             scale=scale,
             round_to=0.01,
-            post_process=lambda v: abs(v) if v < 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_negative_magnitude,
+            validate=_RANGE_0_100,
         )
 
     yield from _grid_ct(
-        addresses=[
-            ModbusAddressesSpec(input=[11021], models=Inv.H1_G1),
-            ModbusAddressesSpec(holding=[31014], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET),
-            ModbusAddressesSpec(holding=[39169, 39168], models=Inv.KH_133),
-        ],
+        addresses=_GRID_CT_ADDRESSES,
         scale=0.001,
     )
     yield from _grid_ct(
-        addresses=[
-            ModbusAddressesSpec(input=[11021], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[31050, 31049], models=Inv.KH_PRE133),
-        ],
+        addresses=_GRID_CT_ADDRESSES_KH,
         scale=-0.001,
     )
 
@@ -745,27 +870,27 @@ def _h1_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key="ct2_meter",
             addresses=addresses,
             name="CT2 Meter",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _ct2_meter(
         addresses=[
-            ModbusAddressesSpec(input=[11022], models=Inv.H1_G1),
-            ModbusAddressesSpec(holding=[31015], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET),
+            ModbusAddressesSpec(input=_addr(11022), models=Inv.H1_G1),
+            ModbusAddressesSpec(holding=_addr(31015), models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET),
         ],
         scale=0.001,
     )
     yield _ct2_meter(
         addresses=[
-            ModbusAddressesSpec(input=[11022], models=Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11022), models=Inv.KH_PRE119),
             ModbusAddressesSpec(holding=[31052, 31051], models=Inv.KH_PRE133),
-            ModbusAddressesSpec(holding=[31015], models=Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31015), models=Inv.KH_133),
         ],
         scale=-0.001,
     )
@@ -778,34 +903,34 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             entity_registry_enabled_default=False,
             name=f"Grid Voltage {phase}",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_V,
             scale=0.1,
             round_to=1,
             signed=False,
-            validate=[Range(0, 300)],
+            validate=_RANGE_0_300,
         )
 
     yield _grid_voltage(
         "R",
         addresses=[
-            ModbusAddressesSpec(holding=[31006], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39123], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31006), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(39123), models=_H3_PRO_AND_SMART),
         ],
     )
     yield _grid_voltage(
         "S",
         addresses=[
-            ModbusAddressesSpec(holding=[31007], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39124], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31007), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(39124), models=_H3_PRO_AND_SMART),
         ],
     )
     yield _grid_voltage(
         "T",
         addresses=[
-            ModbusAddressesSpec(holding=[31008], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39125], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31008), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(39125), models=_H3_PRO_AND_SMART),
         ],
     )
 
@@ -815,31 +940,31 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             entity_registry_enabled_default=False,
             name=f"Inverter Voltage {phase}",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_V,
             scale=0.1,
             round_to=1,
             signed=False,
-            validate=[Range(0, 300)],
+            validate=_RANGE_0_300,
         )
 
     yield _inv_voltage(
         "R",
         addresses=[
-            ModbusAddressesSpec(holding=[31052], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31052), models=Inv.H3_SET),
         ],
     )
     yield _inv_voltage(
         "S",
         addresses=[
-            ModbusAddressesSpec(holding=[31053], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31053), models=Inv.H3_SET),
         ],
     )
     yield _inv_voltage(
         "T",
         addresses=[
-            ModbusAddressesSpec(holding=[31054], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31054), models=Inv.H3_SET),
         ],
     )
 
@@ -848,12 +973,12 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key=f"inv_current_{phase}",
             addresses=addresses,
             name=f"Inverter Current {phase}",
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="A",
+            device_class=_CURRENT,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_A,
             scale=scale,
             round_to=1,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
 
     def _inv_current_set(
@@ -867,16 +992,16 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         yield _inv_current("T", addresses=t_addresses, scale=scale)
 
     yield from _inv_current_set(
-        r_addresses=[ModbusAddressesSpec(holding=[31009], models=Inv.H3_SET)],
-        s_addresses=[ModbusAddressesSpec(holding=[31010], models=Inv.H3_SET)],
-        t_addresses=[ModbusAddressesSpec(holding=[31011], models=Inv.H3_SET)],
+        r_addresses=[ModbusAddressesSpec(holding=_addr(31009), models=Inv.H3_SET)],
+        s_addresses=[ModbusAddressesSpec(holding=_addr(31010), models=Inv.H3_SET)],
+        t_addresses=[ModbusAddressesSpec(holding=_addr(31011), models=Inv.H3_SET)],
         scale=0.1,
     )
 
     yield from _inv_current_set(
-        r_addresses=[ModbusAddressesSpec(holding=[39127, 39126], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        s_addresses=[ModbusAddressesSpec(holding=[39129, 39128], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        t_addresses=[ModbusAddressesSpec(holding=[39131, 39130], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        r_addresses=[ModbusAddressesSpec(holding=[39127, 39126], models=_H3_PRO_AND_SMART)],
+        s_addresses=[ModbusAddressesSpec(holding=[39129, 39128], models=_H3_PRO_AND_SMART)],
+        t_addresses=[ModbusAddressesSpec(holding=[39131, 39130], models=_H3_PRO_AND_SMART)],
         scale=0.001,
     )
 
@@ -887,18 +1012,18 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key=f"inv_power{key_suffix}",
             addresses=addresses,
             name=f"Inverter Power{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _inv_power(
         phase=None,
         addresses=[
-            ModbusAddressesSpec(holding=[39135, 39134], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39135, 39134], models=_H3_PRO_AND_SMART),
         ],
         # This one appears to be in mW, despite what the spec says
         scale=0.000001,
@@ -913,24 +1038,24 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
     yield _inv_power(
         "R",
         addresses=[
-            ModbusAddressesSpec(holding=[31012], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39249, 39248], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31012), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39249, 39248], models=_H3_PRO_AND_SMART),
         ],
         scale=0.001,
     )
     yield _inv_power(
         "S",
         addresses=[
-            ModbusAddressesSpec(holding=[31013], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39251, 39250], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31013), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39251, 39250], models=_H3_PRO_AND_SMART),
         ],
         scale=0.001,
     )
     yield _inv_power(
         "T",
         addresses=[
-            ModbusAddressesSpec(holding=[31014], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39253, 39252], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31014), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39253, 39252], models=_H3_PRO_AND_SMART),
         ],
         scale=0.001,
     )
@@ -941,13 +1066,13 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             ModbusAddressesSpec(holding=[31150, 31149], models=Inv.H3_180),
         ],
         name="Parallel System AC Power",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="kW",
+        device_class=_POWER,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_KW,
         icon="mdi:meter-electric-outline",
         scale=0.001,
         round_to=0.01,
-        validate=[Range(-100, 100)],
+        validate=_RANGE_NEG100_100,
     )
 
     def _inv_power_reactive(phase: str | None, addresses: list[ModbusAddressesSpec]) -> EntityFactory:
@@ -959,27 +1084,27 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             entity_registry_enabled_default=False,
             name=f"Inverter Power (Reactive){name_suffix}",
             # REACTIVE_POWER only supports var, not kvar
-            # device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kvar",
+            # device_class=_REACTIVE_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KVAR,
             icon="mdi:export",
             scale=0.001,
             round_to=0.01,
             # Negative = charging batteries
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _inv_power_reactive(
-        phase=None, addresses=[ModbusAddressesSpec(holding=[39137, 39136], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        phase=None, addresses=[ModbusAddressesSpec(holding=[39137, 39136], models=_H3_PRO_AND_SMART)]
     )
     yield _inv_power_reactive(
-        phase="R", addresses=[ModbusAddressesSpec(holding=[39257, 39256], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        phase="R", addresses=[ModbusAddressesSpec(holding=[39257, 39256], models=_H3_PRO_AND_SMART)]
     )
     yield _inv_power_reactive(
-        phase="S", addresses=[ModbusAddressesSpec(holding=[39259, 39258], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        phase="S", addresses=[ModbusAddressesSpec(holding=[39259, 39258], models=_H3_PRO_AND_SMART)]
     )
     yield _inv_power_reactive(
-        phase="T", addresses=[ModbusAddressesSpec(holding=[39261, 39260], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        phase="T", addresses=[ModbusAddressesSpec(holding=[39261, 39260], models=_H3_PRO_AND_SMART)]
     )
 
     def _inv_power_apparent(phase: str | None, addresses: list[ModbusAddressesSpec]) -> EntityFactory:
@@ -991,42 +1116,42 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             entity_registry_enabled_default=False,
             name=f"Inverter Power (Apparent){name_suffix}",
             # APPARENT_POWER only supports VA, not kVA
-            # device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kVA",
+            # device_class=_APPARENT_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KVA,
             icon="mdi:export",
             scale=0.001,
             round_to=0.01,
             # Negative = charging batteries
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _inv_power_apparent(
         phase=None,
         addresses=[
-            ModbusAddressesSpec(holding=[39271, 39270], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39271, 39270], models=_H3_PRO_AND_SMART),
             ModbusAddressesSpec(holding=[31056, 31055], models=Inv.H3_180),
         ],
     )
     yield _inv_power_apparent(
         phase="R",
         addresses=[
-            ModbusAddressesSpec(holding=[39265, 39264], models=Inv.H3_PRO_SET | Inv.H3_SMART),
-            ModbusAddressesSpec(holding=[31057], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=[39265, 39264], models=_H3_PRO_AND_SMART),
+            ModbusAddressesSpec(holding=_addr(31057), models=Inv.H3_180),
         ],
     )
     yield _inv_power_apparent(
         phase="S",
         addresses=[
-            ModbusAddressesSpec(holding=[39267, 39266], models=Inv.H3_PRO_SET | Inv.H3_SMART),
-            ModbusAddressesSpec(holding=[31058], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=[39267, 39266], models=_H3_PRO_AND_SMART),
+            ModbusAddressesSpec(holding=_addr(31058), models=Inv.H3_180),
         ],
     )
     yield _inv_power_apparent(
         phase="T",
         addresses=[
-            ModbusAddressesSpec(holding=[39269, 39268], models=Inv.H3_PRO_SET | Inv.H3_SMART),
-            ModbusAddressesSpec(holding=[31059], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=[39269, 39268], models=_H3_PRO_AND_SMART),
+            ModbusAddressesSpec(holding=_addr(31059), models=Inv.H3_180),
         ],
     )
 
@@ -1036,26 +1161,26 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             entity_registry_enabled_default=False,
             name=f"EPS Voltage_{phase}",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_V,
             scale=0.1,
             round_to=1,
             signed=False,
-            validate=[Range(0, 300)],
+            validate=_RANGE_0_300,
         )
 
     yield _eps_rvolt("R", addresses=[
-        ModbusAddressesSpec(holding=[31016], models=Inv.H3_180),
-        ModbusAddressesSpec(holding=[39201], models=Inv.H3_PRO_SET | Inv.H3_SMART)
+        ModbusAddressesSpec(holding=_addr(31016), models=Inv.H3_180),
+        ModbusAddressesSpec(holding=_addr(39201), models=_H3_PRO_AND_SMART)
     ])
     yield _eps_rvolt("S", addresses=[
-        ModbusAddressesSpec(holding=[31017], models=Inv.H3_180),
-        ModbusAddressesSpec(holding=[39202], models=Inv.H3_PRO_SET | Inv.H3_SMART)
+        ModbusAddressesSpec(holding=_addr(31017), models=Inv.H3_180),
+        ModbusAddressesSpec(holding=_addr(39202), models=_H3_PRO_AND_SMART)
     ])
     yield _eps_rvolt("T", addresses=[
-        ModbusAddressesSpec(holding=[31018], models=Inv.H3_180),
-        ModbusAddressesSpec(holding=[39203], models=Inv.H3_PRO_SET | Inv.H3_SMART)
+        ModbusAddressesSpec(holding=_addr(31018), models=Inv.H3_180),
+        ModbusAddressesSpec(holding=_addr(39203), models=_H3_PRO_AND_SMART)
     ])
 
     def _eps_rcurrent(phase: str, scale: float, addresses: list[ModbusAddressesSpec]) -> EntityFactory:
@@ -1064,43 +1189,43 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             entity_registry_enabled_default=False,
             name=f"EPS Current {phase}",
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="A",
+            device_class=_CURRENT,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_A,
             scale=scale,
             round_to=1,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
 
     yield _eps_rcurrent(
         "R",
         scale=0.001,
-        addresses=[ModbusAddressesSpec(holding=[39205, 39204], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[39205, 39204], models=_H3_PRO_AND_SMART)],
     )
     yield _eps_rcurrent(
         "R",
         scale=0.1,
-        addresses=[ModbusAddressesSpec(holding=[31019], models=Inv.H3_SET)],
+        addresses=[ModbusAddressesSpec(holding=_addr(31019), models=Inv.H3_SET)],
     )
     yield _eps_rcurrent(
         "S",
         scale=0.001,
-        addresses=[ModbusAddressesSpec(holding=[39207, 39206], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[39207, 39206], models=_H3_PRO_AND_SMART)],
     )
     yield _eps_rcurrent(
         "S",
         scale=0.1,
-        addresses=[ModbusAddressesSpec(holding=[31020], models=Inv.H3_SET)],
+        addresses=[ModbusAddressesSpec(holding=_addr(31020), models=Inv.H3_SET)],
     )
     yield _eps_rcurrent(
         "T",
         scale=0.001,
-        addresses=[ModbusAddressesSpec(holding=[39209, 39208], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[39209, 39208], models=_H3_PRO_AND_SMART)],
     )
     yield _eps_rcurrent(
         "T",
         scale=0.1,
-        addresses=[ModbusAddressesSpec(holding=[31021], models=Inv.H3_SET)],
+        addresses=[ModbusAddressesSpec(holding=_addr(31021), models=Inv.H3_SET)],
     )
 
     def _eps_power(phase: str, addresses: list[ModbusAddressesSpec]) -> EntityFactory:
@@ -1112,45 +1237,45 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             entity_registry_enabled_default=False,
             name=f"EPS Power {name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:power-socket",
             scale=0.001,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _eps_power(
         phase=None,
         addresses=[
             ModbusAddressesSpec(holding=[31138, 31137], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39217, 39216], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39217, 39216], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _eps_power(
         "R",
         addresses=[
-            ModbusAddressesSpec(holding=[31022], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39211, 39210], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31022), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39211, 39210], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _eps_power(
         "S",
         addresses=[
-            ModbusAddressesSpec(holding=[31023], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39213, 39212], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31023), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39213, 39212], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _eps_power(
         "T",
         addresses=[
-            ModbusAddressesSpec(holding=[31024], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39215, 39214], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31024), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39215, 39214], models=_H3_PRO_AND_SMART),
         ],
     )
 
-    def _grid_ct(phase: str | None, scale: float, addresses: list[ModbusAddressesSpec]) -> Iterable[EntityFactory]:
+    def _grid_ct(phase: str | None, scale: float, addresses: Sequence[ModbusAddressesSpec]) -> Iterable[EntityFactory]:
         key_suffix = f"_{phase}" if phase is not None else ""
         name_suffix = f" {phase}" if phase is not None else ""
 
@@ -1158,46 +1283,46 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key=f"grid_ct{key_suffix}",
             addresses=addresses,
             name=f"Grid CT{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
         yield ModbusSensorDescription(
             key=f"feed_in{key_suffix}",
             addresses=addresses,
             name=f"Feed-in{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:transmission-tower-import",
             scale=scale,
             round_to=0.01,
-            post_process=lambda v: v if v > 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_positive_only,
+            validate=_RANGE_0_100,
         )
         yield ModbusSensorDescription(
             key=f"grid_consumption{key_suffix}",
             addresses=addresses,
             name=f"Grid Consumption{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:transmission-tower-export",
             scale=scale,
             round_to=0.01,
-            post_process=lambda v: abs(v) if v < 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_negative_magnitude,
+            validate=_RANGE_0_100,
         )
 
     yield from _grid_ct(
         phase=None,
         scale=0.0001,  # 0.1W
         addresses=[
-            ModbusAddressesSpec(holding=[38815, 38814], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[38815, 38814], models=_H3_PRO_AND_SMART),
         ],
     )
     yield from _grid_ct(
@@ -1218,7 +1343,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         "R",
         scale=0.0001,
         addresses=[
-            ModbusAddressesSpec(holding=[38817, 38816], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[38817, 38816], models=_H3_PRO_AND_SMART),
         ],
     )
     yield from _grid_ct(
@@ -1232,7 +1357,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         "S",
         scale=0.0001,
         addresses=[
-            ModbusAddressesSpec(holding=[38819, 38818], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[38819, 38818], models=_H3_PRO_AND_SMART),
         ],
     )
     yield from _grid_ct(
@@ -1246,7 +1371,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         "T",
         scale=0.0001,
         addresses=[
-            ModbusAddressesSpec(holding=[38821, 38820], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[38821, 38820], models=_H3_PRO_AND_SMART),
         ],
     )
 
@@ -1260,13 +1385,13 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             name=f"Grid CT (Reactive){name_suffix}",
             entity_registry_enabled_default=False,
             # REACTIVE_POWER only supports var, not kvar
-            # device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kvar",
+            # device_class=_REACTIVE_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KVAR,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     def _grid_ct_reactive_set(
@@ -1306,13 +1431,13 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             name=f"Grid CT (Apparent){name_suffix}",
             entity_registry_enabled_default=False,
             # APPARENT_POWER only supports VA, not kVA
-            # device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kVA",
+            # device_class=_APPARENT_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KVA,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     def _grid_ct_apparent_set(
@@ -1345,13 +1470,13 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             name=f"Grid CT Power Factor{name_suffix}",
             entity_registry_enabled_default=False,
             native_unit_of_measurement=None,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_POWER_FACTOR,
+            state_class=_MEASUREMENT,
             # Power factor is a ratio with no unit. Supposedly gain 1000, but comes out as .01
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.001,
-            validate=[Range(-1, 1)],
+            validate=_range(-1, 1),
         )
 
     def _grid_ct_power_factor_set(
@@ -1374,10 +1499,10 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         scale=0.00001, # modbus scale: 1000
     )
     yield from _grid_ct_power_factor_set(
-        addresses=[ModbusAddressesSpec(holding=[31081], models=Inv.H3_180)],
-        r_addresses=[ModbusAddressesSpec(holding=[31082], models=Inv.H3_180)],
-        s_addresses=[ModbusAddressesSpec(holding=[31083], models=Inv.H3_180)],
-        t_addresses=[ModbusAddressesSpec(holding=[31084], models=Inv.H3_180)],
+        addresses=[ModbusAddressesSpec(holding=_addr(31081), models=Inv.H3_180)],
+        r_addresses=[ModbusAddressesSpec(holding=_addr(31082), models=Inv.H3_180)],
+        s_addresses=[ModbusAddressesSpec(holding=_addr(31083), models=Inv.H3_180)],
+        t_addresses=[ModbusAddressesSpec(holding=_addr(31084), models=Inv.H3_180)],
         scale=0.01,  # modbus scale: 100
     )
 
@@ -1389,19 +1514,19 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key=f"ct2_meter{key_suffix}",
             addresses=addresses,
             name=f"CT2 Meter{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:meter-electric-outline",
             scale=scale,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _ct2_meter(
         phase=None,
         scale=0.0001,
-        addresses=[ModbusAddressesSpec(holding=[38915, 38914], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[38915, 38914], models=_H3_PRO_AND_SMART)],
     )
     yield _ct2_meter(
         phase=None,
@@ -1409,7 +1534,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         addresses=[ModbusAddressesSpec(holding=[31108, 31107], models=Inv.H3_180)],
     )
     yield _ct2_meter(
-        "R", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38917, 38916], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        "R", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38917, 38916], models=_H3_PRO_AND_SMART)]
     )
     yield _ct2_meter(
         "R",
@@ -1417,7 +1542,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         addresses=[ModbusAddressesSpec(holding=[31110, 31109], models=Inv.H3_180)],
     )
     yield _ct2_meter(
-        "S", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38919, 38918], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        "S", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38919, 38918], models=_H3_PRO_AND_SMART)]
     )
     yield _ct2_meter(
         "S",
@@ -1425,7 +1550,7 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
         addresses=[ModbusAddressesSpec(holding=[31112, 31111], models=Inv.H3_180)],
     )
     yield _ct2_meter(
-        "T", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38921, 38920], models=Inv.H3_PRO_SET | Inv.H3_SMART)]
+        "T", scale=0.0001, addresses=[ModbusAddressesSpec(holding=[38921, 38920], models=_H3_PRO_AND_SMART)]
     )
     yield _ct2_meter(
         "T",
@@ -1440,41 +1565,41 @@ def _h3_current_voltage_power_entities() -> Iterable[EntityFactory]:
             key=f"load_power{key_suffix}",
             addresses=addresses,
             name=f"Load Power{name_suffix}",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:home-lightning-bolt-outline",
             scale=0.001,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _load_power(
         "R",
         addresses=[
             ModbusAddressesSpec(holding=[31129, 31128], models=Inv.H3_180),
-            ModbusAddressesSpec(holding=[39220, 39219], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39220, 39219], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _load_power(
         "S",
         addresses=[
             ModbusAddressesSpec(holding=[31131, 31130], models=Inv.H3_180),
-            ModbusAddressesSpec(holding=[39222, 39221], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39222, 39221], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _load_power(
         "T",
         addresses=[
             ModbusAddressesSpec(holding=[31133, 31132], models=Inv.H3_180),
-            ModbusAddressesSpec(holding=[39224, 39223], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39224, 39223], models=_H3_PRO_AND_SMART),
         ],
     )
     yield _load_power(
         phase=None,
         addresses=[
             ModbusAddressesSpec(holding=[31127, 31126], models=Inv.H3_180),
-            ModbusAddressesSpec(holding=[39226, 39225], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39226, 39225], models=_H3_PRO_AND_SMART),
         ],
     )
 
@@ -1487,9 +1612,9 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key=f"invbatvolt{key_suffix}",
             addresses=addresses,
             name=f"Inverter Battery{name_infix} Voltage",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_V,
             scale=0.1,
             round_to=1,
             # This can go negative if no battery is attached
@@ -1498,14 +1623,14 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     yield _invbatvolt(
         index=None,
         addresses=[
-            ModbusAddressesSpec(input=[11006], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11006), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31020], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31020), models=_H1_SET_AND_KH
             ),
         ],
     )
-    yield _invbatvolt(index=1, addresses=[ModbusAddressesSpec(holding=[39227], models=Inv.H3_PRO_SET | Inv.H3_SMART)])
-    yield _invbatvolt(index=2, addresses=[ModbusAddressesSpec(holding=[39232], models=Inv.H3_PRO_SET | Inv.H3_SMART)])
+    yield _invbatvolt(index=1, addresses=[ModbusAddressesSpec(holding=_addr(39227), models=_H3_PRO_AND_SMART)])
+    yield _invbatvolt(index=2, addresses=[ModbusAddressesSpec(holding=_addr(39232), models=_H3_PRO_AND_SMART)])
 
     def _invbatcurrent(index: int | None, scale: float, addresses: list[ModbusAddressesSpec]) -> EntityFactory:
         key_suffix = f"_{index}" if index is not None else ""
@@ -1514,33 +1639,33 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key=f"invbatcurrent{key_suffix}",
             addresses=addresses,
             name=f"Inverter Battery{name_infix} Current",
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="A",
+            device_class=_CURRENT,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_A,
             scale=scale,
             round_to=1,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _invbatcurrent(
         index=None,
         scale=0.1,
         addresses=[
-            ModbusAddressesSpec(input=[11007], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11007), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31021], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31021), models=_H1_SET_AND_KH
             ),
         ],
     )
     yield _invbatcurrent(
         index=1,
         scale=0.001,
-        addresses=[ModbusAddressesSpec(holding=[39229, 39228], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[39229, 39228], models=_H3_PRO_AND_SMART)],
     )
     yield _invbatcurrent(
         index=2,
         scale=0.001,
-        addresses=[ModbusAddressesSpec(holding=[39234, 39233], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        addresses=[ModbusAddressesSpec(holding=[39234, 39233], models=_H3_PRO_AND_SMART)],
     )
 
     def _invbatpower(index: int | None, addresses: list[ModbusAddressesSpec]) -> Iterable[ModbusSensorDescription]:
@@ -1550,55 +1675,55 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key=f"invbatpower{key_suffix}",
             addresses=addresses,
             name=f"Inverter Battery{name_infix} Power",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             scale=0.001,
             round_to=0.01,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
         yield ModbusSensorDescription(
             key=f"battery_discharge{key_suffix}",
             addresses=addresses,
             name=f"Battery{name_infix} Discharge",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:battery-arrow-down-outline",
             scale=0.001,
             round_to=0.01,
-            post_process=lambda v: v if v > 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_positive_only,
+            validate=_RANGE_0_100,
         )
         yield ModbusSensorDescription(
             key=f"battery_charge{key_suffix}",
             addresses=addresses,
             name=f"Battery{name_infix} Charge",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="kW",
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_KW,
             icon="mdi:battery-arrow-up-outline",
             scale=0.001,
             round_to=0.01,
-            post_process=lambda v: abs(v) if v < 0 else 0,
-            validate=[Range(0, 100)],
+            post_process=_negative_magnitude,
+            validate=_RANGE_0_100,
         )
 
     yield from _invbatpower(
         index=None,
         addresses=[
-            ModbusAddressesSpec(input=[11008], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11008), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31022], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31022), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31036], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39238, 39237], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31036), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=[39238, 39237], models=_H3_PRO_AND_SMART),
         ],
     )
     yield from _invbatpower(
         index=1,
         addresses=[
-            ModbusAddressesSpec(holding=[39231, 39230], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39231, 39230], models=_H3_PRO_AND_SMART),
         ],
     )
     yield from _invbatpower(
@@ -1610,26 +1735,26 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             # the H3 Pro firmware from Master 1.53, Manager 1.22 has corrected the endian for this
             # batpower2 register; it now matches the Fox modbus definition V1.05.00.00
             # see https://github.com/nathanmarlor/foxess_modbus/discussions/685#discussioncomment-10811413
-            ModbusAddressesSpec(holding=[39236, 39235], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=[39236, 39235], models=_H3_PRO_AND_SMART),
         ],
     )
 
     grid_phase_freq_address_map = {
         "R": [
-            ModbusAddressesSpec(input=[11014], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11014), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31009],
-                models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(31009),
+                models=_H1_SET_AND_KH,
             ),
-            ModbusAddressesSpec(holding=[31015], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31015), models=Inv.H3_SET),
             ModbusAddressesSpec(holding=[38847, 38846], models=Inv.H3_PRO_PRE122),
-            ModbusAddressesSpec(holding=[39139], models=Inv.H3_PRO_122),
+            ModbusAddressesSpec(holding=_addr(39139), models=Inv.H3_PRO_122),
         ],
         "S": [
-            ModbusAddressesSpec(holding=[31085], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=_addr(31085), models=Inv.H3_180),
         ], 
         "T": [
-            ModbusAddressesSpec(holding=[31086], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=_addr(31086), models=Inv.H3_180),
         ],
     }
 
@@ -1640,132 +1765,132 @@ def _inverter_entities() -> Iterable[EntityFactory]:
                 addresses=addresses,
                 entity_registry_enabled_default=False,
                 name=f"Grid {phase} Frequency",
-                device_class=SensorDeviceClass.FREQUENCY,
-                state_class=SensorStateClass.MEASUREMENT,
+                device_class=_FREQUENCY,
+                state_class=_MEASUREMENT,
                 native_unit_of_measurement="Hz",
                 scale=0.01,
                 round_to=0.1,
                 signed=False,
-                validate=[Range(0, 60)],
+                validate=_range(0, 60),
             )
 
     yield ModbusSensorDescription(
         key="eps_frequency",
         addresses=[
-            ModbusAddressesSpec(input=[11020], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11020), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31013], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31013), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31025], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31025), models=Inv.H3_SET),
         ],
         entity_registry_enabled_default=False,
         name="EPS Frequency",
-        device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_FREQUENCY,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement="Hz",
         scale=0.01,
         round_to=0.1,
         signed=False,
-        validate=[Range(0, 60)],
+        validate=_range(0, 60),
     )
     yield ModbusSensorDescription(
         key="invtemp",
         addresses=[
-            ModbusAddressesSpec(input=[11024], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11024), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31018], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31018), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31032], models=Inv.H3_SET),
-            ModbusAddressesSpec(holding=[39141], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(31032), models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(39141), models=_H3_PRO_AND_SMART),
         ],
         name="Inverter Temp",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_TEMPERATURE,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement="°C",
         scale=0.1,
         round_to=0.5,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusSensorDescription(
         key="ambtemp",
         addresses=[
-            ModbusAddressesSpec(input=[11025], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11025), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31019], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31019), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31033], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31033), models=Inv.H3_SET),
         ],
         name="Ambient Temp",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_TEMPERATURE,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement="°C",
         scale=0.1,
         round_to=0.5,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusBatterySensorDescription(
         key="bms_charge_rate",
         addresses=[
-            ModbusAddressesSpec(input=[11041], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11041), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31025], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31025), models=_H1_SET_AND_KH
             ),
         ],
         entity_registry_enabled_default=False,
         bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
         name="BMS Charge Rate",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
         signed=False,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusBatterySensorDescription(
         key="bms_discharge_rate",
         addresses=[
-            ModbusAddressesSpec(input=[11042], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11042), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31026], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31026), models=_H1_SET_AND_KH
             ),
         ],
         entity_registry_enabled_default=False,
         bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
         name="BMS Discharge Rate",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
         signed=False,
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusBatterySensorDescription(
         key="bms_cycle_count",
         addresses=[
-            ModbusAddressesSpec(input=[11048], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11048), models=_H1_G1_AND_KH_PRE119),
         ],
         bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
         name="BMS Cycle Count",
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
         icon="mdi:counter",
         signed=False,
-        validate=[Min(0)],
+        validate=_MIN_0,
     )
     yield ModbusBatterySensorDescription(
         key="bms_watthours_total",
         addresses=[
-            ModbusAddressesSpec(input=[11049], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11049), models=_H1_G1_AND_KH_PRE119),
         ],
         bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
         entity_registry_enabled_default=False,
         name="BMS Energy Throughput",
-        device_class=SensorDeviceClass.ENERGY,
-        state_class=SensorStateClass.TOTAL,
+        device_class=_ENERGY,
+        state_class=_TOTAL,
         native_unit_of_measurement="kWh",
         scale=0.001,
         round_to=1,
         signed=False,
-        validate=[Min(0)],
+        validate=_MIN_0,
     )
 
     def _inverter_fault_code(addresses: list[ModbusAddressesSpec], fault_set: FaultSet) -> EntityFactory:
@@ -1838,7 +1963,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             ModbusAddressSpec(holding=31041, models=Inv.H3_SET),
         ],
         name="Inverter State Code",
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
     )
 
     def _solar_energy_total(addresses: list[ModbusAddressesSpec], scale: float) -> EntityFactory:
@@ -1847,20 +1972,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="solar_energy_total",
             addresses=addresses,
             name="Solar Generation Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:solar-power",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _solar_energy_total(
         addresses=[
-            ModbusAddressesSpec(input=[11070, 11069], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11070, 11069], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32001, 32000], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32001, 32000], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39602, 39601], models=Inv.H3_PRO_PRE122),
         ],
@@ -1868,13 +1993,13 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     )
     yield _solar_energy_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39602, 39601], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39602, 39601], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
 
     def _solar_energy_today(
-        addresses: list[ModbusAddressesSpec], scale: float, validate: list[BaseValidator] | None = None
+        addresses: list[ModbusAddressesSpec], scale: float, validate: Sequence[BaseValidator] | None = None
     ) -> EntityFactory:
         if validate is None:
             validate = [Range(0, 1000)]
@@ -1882,8 +2007,8 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="solar_energy_today",
             addresses=addresses,
             name="Solar Generation Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:solar-power",
             scale=scale,
@@ -1896,17 +2021,17 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     # 144kWh, so we'll put a limit of 150. (The false values we were seeing were all 600kWh plus)
     yield _solar_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11071], holding=[32002], models=Inv.H1_G1),
+            ModbusAddressesSpec(input=_addr(11071), holding=_addr(32002), models=Inv.H1_G1),
         ],
         scale=0.1,
-        validate=[Range(0, 150)],
+        validate=_range(0, 150),
     )
 
     yield _solar_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11071], models=Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11071), models=Inv.KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32002], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32002), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39604, 39603], models=Inv.H3_PRO_PRE122),
         ],
@@ -1914,7 +2039,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     )
     yield _solar_energy_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39604, 39603], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39604, 39603], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -1924,20 +2049,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="battery_charge_total",
             addresses=addresses,
             name="Battery Charge Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:battery-arrow-up-outline",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _battery_charge_total(
         addresses=[
-            ModbusAddressesSpec(input=[11073, 11072], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11073, 11072], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32004, 32003], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32004, 32003], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39606, 39605], models=Inv.H3_PRO_PRE122),
         ],
@@ -1945,7 +2070,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     )
     yield _battery_charge_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39606, 39605], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39606, 39605], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -1955,13 +2080,13 @@ def _inverter_entities() -> Iterable[EntityFactory]:
         models=[
             EntitySpec(register_types=[RegisterType.HOLDING], models=Inv.H1_LAN),
         ],
-        device_class=SensorDeviceClass.ENERGY,
+        device_class=_ENERGY,
         native_unit_of_measurement="kWh",
         icon="mdi:battery-arrow-up-outline",
         integration_method="left",
         name="Battery Charge Total",
         source_entity="battery_charge",
-        unit_time=UnitOfTime.HOURS,
+        unit_time=_HOURS,
     )
 
     def _battery_charge_today(addresses: list[ModbusAddressesSpec], scale: float) -> EntityFactory:
@@ -1969,26 +2094,26 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="battery_charge_today",
             addresses=addresses,
             name="Battery Charge Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:battery-arrow-up-outline",
             scale=scale,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
 
     yield _battery_charge_today(
         addresses=[
-            ModbusAddressesSpec(input=[11074], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[32005], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET),
-            ModbusAddressesSpec(holding=[32005], models=Inv.KH_PRE133 | Inv.KH_133),
+            ModbusAddressesSpec(input=_addr(11074), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(32005), models=_H1_G1_G2_AND_H3),
+            ModbusAddressesSpec(holding=_addr(32005), models=Inv.KH_PRE133 | Inv.KH_133),
             ModbusAddressesSpec(holding=[39608, 39607], models=Inv.H3_PRO_PRE122),
         ],
         scale=0.1,
     )
     yield _battery_charge_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39608, 39607], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39608, 39607], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -1998,20 +2123,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="battery_discharge_total",
             addresses=addresses,
             name="Battery Discharge Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:battery-arrow-down-outline",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _battery_discharge_total(
         addresses=[
-            ModbusAddressesSpec(input=[11076, 11075], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11076, 11075], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32007, 32006], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32007, 32006], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39610, 39609], models=Inv.H3_PRO_PRE122),
         ],
@@ -2019,7 +2144,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
     )
     yield _battery_discharge_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39610, 39609], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39610, 39609], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2029,13 +2154,13 @@ def _inverter_entities() -> Iterable[EntityFactory]:
         models=[
             EntitySpec(register_types=[RegisterType.HOLDING], models=Inv.H1_LAN),
         ],
-        device_class=SensorDeviceClass.ENERGY,
+        device_class=_ENERGY,
         native_unit_of_measurement="kWh",
         icon="mdi:battery-arrow-down-outline",
         integration_method="left",
         name="Battery Discharge Total",
         source_entity="battery_discharge",
-        unit_time=UnitOfTime.HOURS,
+        unit_time=_HOURS,
     )
 
     def _battery_discharge_today(addresses: list[ModbusAddressesSpec], scale: float) -> EntityFactory:
@@ -2043,19 +2168,19 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="battery_discharge_today",
             addresses=addresses,
             name="Battery Discharge Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:battery-arrow-down-outline",
             scale=scale,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
 
     yield _battery_discharge_today(
         addresses=[
-            ModbusAddressesSpec(input=[11077], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11077), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32008], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32008), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39612, 39611], models=Inv.H3_PRO_PRE122),
         ],
@@ -2064,7 +2189,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _battery_discharge_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39612, 39611], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39612, 39611], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2074,20 +2199,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="feed_in_energy_total",
             addresses=addresses,
             name="Feed-in Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:transmission-tower-import",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _feed_in_energy_total(
         addresses=[
-            ModbusAddressesSpec(input=[11079, 11078], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11079, 11078], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32010, 32009], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32010, 32009], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39614, 39613], models=Inv.H3_PRO_PRE122),
         ],
@@ -2096,7 +2221,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _feed_in_energy_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39614, 39613], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39614, 39613], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2107,11 +2232,11 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             EntitySpec(register_types=[RegisterType.HOLDING], models=Inv.H1_LAN),
         ],
         name="Feed-in Total",
-        device_class=SensorDeviceClass.ENERGY,
+        device_class=_ENERGY,
         native_unit_of_measurement="kWh",
         integration_method="left",
         source_entity="feed_in",
-        unit_time=UnitOfTime.HOURS,
+        unit_time=_HOURS,
         icon="mdi:transmission-tower-import",
     )
 
@@ -2120,19 +2245,19 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="feed_in_energy_today",
             addresses=addresses,
             name="Feed-in Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:transmission-tower-import",
             scale=scale,
-            validate=[Range(0, 1000)],
+            validate=_range(0, 1000),
         )
 
     yield _feed_in_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11080], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11080), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32011], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32011), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39616, 39615], models=Inv.H3_PRO_PRE122),
         ],
@@ -2141,7 +2266,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _feed_in_energy_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39616, 39615], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39616, 39615], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2151,20 +2276,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="grid_consumption_energy_total",
             addresses=addresses,
             name="Grid Consumption Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:transmission-tower-export",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _grid_consumption_energy_total(
         addresses=[
-            ModbusAddressesSpec(input=[11082, 11081], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11082, 11081], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32013, 32012], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32013, 32012], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39618, 39617], models=Inv.H3_PRO_PRE122),
         ],
@@ -2173,7 +2298,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _grid_consumption_energy_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39618, 39617], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39618, 39617], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2183,12 +2308,12 @@ def _inverter_entities() -> Iterable[EntityFactory]:
         models=[
             EntitySpec(register_types=[RegisterType.HOLDING], models=Inv.H1_LAN),
         ],
-        device_class=SensorDeviceClass.ENERGY,
+        device_class=_ENERGY,
         native_unit_of_measurement="kWh",
         integration_method="left",
         name="Grid Consumption Total",
         source_entity="grid_consumption",
-        unit_time=UnitOfTime.HOURS,
+        unit_time=_HOURS,
         icon="mdi:transmission-tower-export",
     )
 
@@ -2198,16 +2323,16 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             addresses=addresses,
             bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
             name=f"System Battery SoC",
-            device_class=SensorDeviceClass.BATTERY,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_BATTERY,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="%",
             signed=False,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
 
     yield _system_soc(
         addresses=[
-            ModbusAddressesSpec(holding=[31141], models=Inv.H3_180),
+            ModbusAddressesSpec(holding=_addr(31141), models=Inv.H3_180),
         ]
     )
 
@@ -2216,19 +2341,19 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="grid_consumption_energy_today",
             addresses=addresses,
             name="Grid Consumption Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:transmission-tower-export",
             scale=scale,
-            validate=[Range(0, 1000)],
+            validate=_range(0, 1000),
         )
 
     yield _grid_consumption_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11083], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11083), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32014], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32014), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39620, 39619], models=Inv.H3_PRO_PRE122),
         ],
@@ -2237,7 +2362,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _grid_consumption_energy_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39620, 39619], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39620, 39619], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2247,20 +2372,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="total_yield_total",
             addresses=addresses,
             name="Yield Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:export",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _total_yield_total(
         addresses=[
-            ModbusAddressesSpec(input=[11085, 11084], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11085, 11084], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32016, 32015], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32016, 32015], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39622, 39621], models=Inv.H3_PRO_PRE122),
         ],
@@ -2269,7 +2394,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _total_yield_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39622, 39621], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39622, 39621], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2279,20 +2404,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="total_yield_today",
             addresses=addresses,
             name="Yield Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:export",
             scale=scale,
             # unsure if this actually goes negative
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
 
     yield _total_yield_today(
         addresses=[
-            ModbusAddressesSpec(input=[11086], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11086), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32017], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32017), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39624, 39623], models=Inv.H3_PRO_PRE122),
         ],
@@ -2301,7 +2426,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _total_yield_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39624, 39623], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39624, 39623], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2311,20 +2436,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="input_energy_total",
             addresses=addresses,
             name="Input Energy Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:import",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _input_energy_total(
         addresses=[
-            ModbusAddressesSpec(input=[11088, 11087], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=[11088, 11087], models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32019, 32018], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=[32019, 32018], models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39626, 39625], models=Inv.H3_PRO_PRE122),
         ],
@@ -2333,7 +2458,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _input_energy_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39626, 39625], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39626, 39625], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2343,20 +2468,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="input_energy_today",
             addresses=addresses,
             name="Input Energy Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:import",
             scale=scale,
             # unsure if this actually goes negative
-            validate=[Range(-1000, 1000)],
+            validate=_range(-1000, 1000),
         )
 
     yield _input_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11089], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11089), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32020], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32020), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39628, 39627], models=Inv.H3_PRO_PRE122),
         ],
@@ -2365,7 +2490,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _input_energy_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39628, 39627], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39628, 39627], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2375,13 +2500,13 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="load_power_total",
             addresses=addresses,
             name="Load Energy Total",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             icon="mdi:home-lightning-bolt-outline",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _load_power_total(
@@ -2399,7 +2524,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _load_power_total(
         addresses=[
-            ModbusAddressesSpec(holding=[39630, 39629], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39630, 39629], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2412,13 +2537,13 @@ def _inverter_entities() -> Iterable[EntityFactory]:
                 models=Inv.H1_G1 | Inv.H1_LAN,
             )
         ],
-        device_class=SensorDeviceClass.ENERGY,
+        device_class=_ENERGY,
         native_unit_of_measurement="kWh",
         icon="mdi:home-lightning-bolt-outline",
         integration_method="left",
         name="Load Energy Total",
         source_entity="load_power",
-        unit_time=UnitOfTime.HOURS,
+        unit_time=_HOURS,
     )
 
     def _load_energy_today(addresses: list[ModbusAddressesSpec], scale: float) -> EntityFactory:
@@ -2426,20 +2551,20 @@ def _inverter_entities() -> Iterable[EntityFactory]:
             key="load_energy_today",
             addresses=addresses,
             name="Load Energy Today",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            device_class=_ENERGY,
+            state_class=_TOTAL_INCREASING,
             native_unit_of_measurement="kWh",
             icon="mdi:home-lightning-bolt-outline",
             scale=scale,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
 
     yield _load_energy_today(
         addresses=[
-            ModbusAddressesSpec(input=[11092], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11092), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[32023], models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(32023), models=_H1_G1_G2_H3_AND_KH
             ),
             ModbusAddressesSpec(holding=[39632, 39631], models=Inv.H3_PRO_PRE122),
         ],
@@ -2448,7 +2573,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 
     yield _load_energy_today(
         addresses=[
-            ModbusAddressesSpec(holding=[39632, 39631], models=Inv.H3_SMART | Inv.H3_PRO_SET & ~Inv.H3_PRO_PRE122),
+            ModbusAddressesSpec(holding=[39632, 39631], models=_H3_PRO_AND_SMART & ~Inv.H3_PRO_PRE122),
         ],
         scale=0.01,
     )
@@ -2457,7 +2582,7 @@ def _inverter_entities() -> Iterable[EntityFactory]:
 def _bms_entities() -> Iterable[EntityFactory]:
     def _inner(
         index: int | None,
-        bms_connect_state_address: list[ModbusAddressSpec],
+        bms_connect_state_address: Sequence[ModbusAddressSpec],
         batvolt: list[ModbusAddressesSpec],
         bat_current: list[ModbusAddressesSpec],
         battery_soc: list[ModbusAddressesSpec],
@@ -2478,114 +2603,114 @@ def _bms_entities() -> Iterable[EntityFactory]:
             key=f"batvolt{key_suffix}",
             addresses=batvolt,
             name=f"Battery{name_infix} Voltage",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="V",
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_V,
             scale=0.1,
             round_to=1,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
         yield ModbusSensorDescription(
             key=f"bat_current{key_suffix}",
             addresses=bat_current,
             name=f"Battery{name_infix} Current",
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT,
-            native_unit_of_measurement="A",
+            device_class=_CURRENT,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=_U_A,
             scale=0.1,
             round_to=1,
-            validate=[Range(-100, 100)],
+            validate=_RANGE_NEG100_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"battery_soc{key_suffix}",
             addresses=battery_soc,
             bms_connect_state_address=bms_connect_state_address,
             name=f"Battery{name_infix} SoC",
-            device_class=SensorDeviceClass.BATTERY,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_BATTERY,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="%",
             signed=False,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"battery_soh{key_suffix}",
             addresses=battery_soh,
             bms_connect_state_address=bms_connect_state_address,
             name=f"Battery{name_infix} SoH",
-            device_class=SensorDeviceClass.BATTERY,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_BATTERY,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="%",
             signed=False,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"battery_temp{key_suffix}",
             addresses=battery_temp,
             bms_connect_state_address=bms_connect_state_address,
             name=f"Battery{name_infix} Temp",
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_TEMPERATURE,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="°C",
             scale=0.1,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_cell_temp_high{key_suffix}",
             addresses=bms_cell_temp_high,
             bms_connect_state_address=bms_connect_state_address,
             name=f"BMS{name_infix} Cell Temp High",
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_TEMPERATURE,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="°C",
             scale=0.1,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_cell_temp_low{key_suffix}",
             addresses=bms_cell_temp_low,
             bms_connect_state_address=bms_connect_state_address,
             name=f"BMS{name_infix} Cell Temp Low",
-            device_class=SensorDeviceClass.TEMPERATURE,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_TEMPERATURE,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="°C",
             scale=0.1,
-            validate=[Range(0, 100)],
+            validate=_RANGE_0_100,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_cell_mv_high{key_suffix}",
             addresses=bms_cell_mv_high,
             bms_connect_state_address=bms_connect_state_address,
             name=f"BMS{name_infix} Cell mV High",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="mV",
             signed=False,
             round_to=10,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_cell_mv_low{key_suffix}",
             addresses=bms_cell_mv_low,
             bms_connect_state_address=bms_connect_state_address,
             name=f"BMS{name_infix} Cell mV Low",
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_VOLTAGE,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="mV",
             signed=False,
             round_to=10,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_kwh_remaining{key_suffix}",
             addresses=bms_kwh_remaining,
             bms_connect_state_address=bms_connect_state_address,
             name=f"BMS{name_infix} kWh Remaining",
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL,
+            device_class=_ENERGY,
+            state_class=_TOTAL,
             native_unit_of_measurement="kWh",
             scale=0.01,
             signed=False,
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_pwr_limit_discharge{key_suffix}",
@@ -2593,10 +2718,10 @@ def _bms_entities() -> Iterable[EntityFactory]:
             bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
             entity_registry_enabled_default=True,
             name="BMS Max Discharge Power",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="W",
-            validate=[Min(0)],
+            validate=_MIN_0,
         )
         yield ModbusBatterySensorDescription(
             key=f"bms_pwr_limit_charge{key_suffix}",
@@ -2604,115 +2729,115 @@ def _bms_entities() -> Iterable[EntityFactory]:
             bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
             entity_registry_enabled_default=True,
             name="BMS Max Charge Power",
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT,
+            device_class=_POWER,
+            state_class=_MEASUREMENT,
             native_unit_of_measurement="W",
-            post_process=lambda v: abs(v) if v < 0 else 0,
-            validate=[Min(0)],
+            post_process=_negative_magnitude,
+            validate=_MIN_0,
         )
 
     yield from _inner(
         index=None,
         bms_connect_state_address=BMS_CONNECT_STATE_ADDRESS,
         batvolt=[
-            ModbusAddressesSpec(input=[11034], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37609], models=Inv.H1_G2_144),
-            ModbusAddressesSpec(holding=[31034], models=Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11034), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37609), models=Inv.H1_G2_144),
+            ModbusAddressesSpec(holding=_addr(31034), models=Inv.H3_SET),
         ],
         bat_current=[
-            ModbusAddressesSpec(input=[11035], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37610], models=Inv.H1_G2_144),
-            ModbusAddressesSpec(holding=[31035], models=Inv.H3_SET),
+            ModbusAddressesSpec(input=_addr(11035), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37610), models=Inv.H1_G2_144),
+            ModbusAddressesSpec(holding=_addr(31035), models=Inv.H3_SET),
         ],
         battery_soc=[
-            ModbusAddressesSpec(input=[11036], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11036), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31024], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31024), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31038], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31038), models=Inv.H3_SET),
         ],
         battery_soh=[
             # Temporarily removed, see #756
-            # ModbusAddressesSpec(input=[11104], models=Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37624], models=Inv.H1_G2_144 | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31090], models=Inv.H3_180),
+            # ModbusAddressesSpec(input=_addr(11104), models=Inv.KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37624), models=Inv.H1_G2_144 | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31090), models=Inv.H3_180),
         ],
         battery_temp=[
-            ModbusAddressesSpec(input=[11038], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(11038), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[31023], models=Inv.H1_G1 | Inv.H1_LAN | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133
+                holding=_addr(31023), models=_H1_SET_AND_KH
             ),
-            ModbusAddressesSpec(holding=[31037], models=Inv.H3_SET),
+            ModbusAddressesSpec(holding=_addr(31037), models=Inv.H3_SET),
         ],
         bms_cell_temp_high=[
-            ModbusAddressesSpec(input=[11043], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37617], models=Inv.H1_G2_144 | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31102], models=Inv.H3_180),
+            ModbusAddressesSpec(input=_addr(11043), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37617), models=Inv.H1_G2_144 | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31102), models=Inv.H3_180),
         ],
         bms_cell_temp_low=[
-            ModbusAddressesSpec(input=[11044], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37618], models=Inv.H1_G2_144 | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31103], models=Inv.H3_180),
+            ModbusAddressesSpec(input=_addr(11044), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37618), models=Inv.H1_G2_144 | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31103), models=Inv.H3_180),
         ],
         bms_cell_mv_high=[
-            ModbusAddressesSpec(input=[11045], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37619], models=Inv.H1_G2_144 | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31134], models=Inv.H3_180),
+            ModbusAddressesSpec(input=_addr(11045), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37619), models=Inv.H1_G2_144 | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31134), models=Inv.H3_180),
         ],
         bms_cell_mv_low=[
-            ModbusAddressesSpec(input=[11046], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37620], models=Inv.H1_G2_144 | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31135], models=Inv.H3_180),
+            ModbusAddressesSpec(input=_addr(11046), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37620), models=Inv.H1_G2_144 | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31135), models=Inv.H3_180),
         ],
         bms_kwh_remaining=[
-            ModbusAddressesSpec(input=[11037], models=Inv.H1_G1 | Inv.KH_PRE119),
-            ModbusAddressesSpec(holding=[37632], models=Inv.H1_G2_SET | Inv.KH_133),
-            ModbusAddressesSpec(holding=[31123], models=Inv.H3_180),
+            ModbusAddressesSpec(input=_addr(11037), models=_H1_G1_AND_KH_PRE119),
+            ModbusAddressesSpec(holding=_addr(37632), models=Inv.H1_G2_SET | Inv.KH_133),
+            ModbusAddressesSpec(holding=_addr(31123), models=Inv.H3_180),
         ],
         # Pwr_limit_Bat_Up
         bms_pwr_limit_discharge=[
-            ModbusAddressesSpec(holding=[44011], models=Inv.H3_SET),
-            ModbusAddressesSpec(input=[46019,46018], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(44011), models=Inv.H3_SET),
+            ModbusAddressesSpec(input=[46019,46018], models=_H3_PRO_AND_SMART),
         ],
         # Pwr_limit_Bat_Dn
         bms_pwr_limit_charge=[
-            ModbusAddressesSpec(holding=[44012], models=Inv.H3_SET),
-            ModbusAddressesSpec(input=[46021,46020], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(44012), models=Inv.H3_SET),
+            ModbusAddressesSpec(input=[46021,46020], models=_H3_PRO_AND_SMART),
         ], 
     )
     yield from _inner(
         index=1,
-        bms_connect_state_address=[ModbusAddressSpec(holding=37002, models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        batvolt=[ModbusAddressesSpec(holding=[37609], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bat_current=[ModbusAddressesSpec(holding=[37610], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        battery_soc=[ModbusAddressesSpec(holding=[37612], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        bms_connect_state_address=[ModbusAddressSpec(holding=37002, models=_H3_PRO_AND_SMART)],
+        batvolt=[ModbusAddressesSpec(holding=_addr(37609), models=_H3_PRO_AND_SMART)],
+        bat_current=[ModbusAddressesSpec(holding=_addr(37610), models=_H3_PRO_AND_SMART)],
+        battery_soc=[ModbusAddressesSpec(holding=_addr(37612), models=_H3_PRO_AND_SMART)],
         # Added in H3_PRO v1.25, which hasn't been released yet.
         # See https://github.com/nathanmarlor/foxess_modbus/pull/775#issuecomment-2656447502
-        battery_soh=[ModbusAddressesSpec(holding=[37624], models=Inv.H3_SMART)],
-        battery_temp=[ModbusAddressesSpec(holding=[37611], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_temp_high=[ModbusAddressesSpec(holding=[37617], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_temp_low=[ModbusAddressesSpec(holding=[37618], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_mv_high=[ModbusAddressesSpec(holding=[37619], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_mv_low=[ModbusAddressesSpec(holding=[37620], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_kwh_remaining=[ModbusAddressesSpec(holding=[37632], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        battery_soh=[ModbusAddressesSpec(holding=_addr(37624), models=Inv.H3_SMART)],
+        battery_temp=[ModbusAddressesSpec(holding=_addr(37611), models=_H3_PRO_AND_SMART)],
+        bms_cell_temp_high=[ModbusAddressesSpec(holding=_addr(37617), models=_H3_PRO_AND_SMART)],
+        bms_cell_temp_low=[ModbusAddressesSpec(holding=_addr(37618), models=_H3_PRO_AND_SMART)],
+        bms_cell_mv_high=[ModbusAddressesSpec(holding=_addr(37619), models=_H3_PRO_AND_SMART)],
+        bms_cell_mv_low=[ModbusAddressesSpec(holding=_addr(37620), models=_H3_PRO_AND_SMART)],
+        bms_kwh_remaining=[ModbusAddressesSpec(holding=_addr(37632), models=_H3_PRO_AND_SMART)],
         bms_pwr_limit_discharge=[],
         bms_pwr_limit_charge=[],
     )
     yield from _inner(
         index=2,
-        bms_connect_state_address=[ModbusAddressSpec(holding=37700, models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        batvolt=[ModbusAddressesSpec(holding=[38307], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bat_current=[ModbusAddressesSpec(holding=[38308], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        battery_soc=[ModbusAddressesSpec(holding=[38310], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        bms_connect_state_address=[ModbusAddressSpec(holding=37700, models=_H3_PRO_AND_SMART)],
+        batvolt=[ModbusAddressesSpec(holding=_addr(38307), models=_H3_PRO_AND_SMART)],
+        bat_current=[ModbusAddressesSpec(holding=_addr(38308), models=_H3_PRO_AND_SMART)],
+        battery_soc=[ModbusAddressesSpec(holding=_addr(38310), models=_H3_PRO_AND_SMART)],
         # Added in H3_PRO v1.25, which hasn't been released yet.
         # See https://github.com/nathanmarlor/foxess_modbus/pull/775#issuecomment-2656447502
-        battery_soh=[ModbusAddressesSpec(holding=[38322], models=Inv.H3_SMART)],
-        battery_temp=[ModbusAddressesSpec(holding=[38309], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_temp_high=[ModbusAddressesSpec(holding=[38315], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_temp_low=[ModbusAddressesSpec(holding=[38316], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_mv_high=[ModbusAddressesSpec(holding=[38317], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_cell_mv_low=[ModbusAddressesSpec(holding=[38318], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
-        bms_kwh_remaining=[ModbusAddressesSpec(holding=[38330], models=Inv.H3_PRO_SET | Inv.H3_SMART)],
+        battery_soh=[ModbusAddressesSpec(holding=_addr(38322), models=Inv.H3_SMART)],
+        battery_temp=[ModbusAddressesSpec(holding=_addr(38309), models=_H3_PRO_AND_SMART)],
+        bms_cell_temp_high=[ModbusAddressesSpec(holding=_addr(38315), models=_H3_PRO_AND_SMART)],
+        bms_cell_temp_low=[ModbusAddressesSpec(holding=_addr(38316), models=_H3_PRO_AND_SMART)],
+        bms_cell_mv_high=[ModbusAddressesSpec(holding=_addr(38317), models=_H3_PRO_AND_SMART)],
+        bms_cell_mv_low=[ModbusAddressesSpec(holding=_addr(38318), models=_H3_PRO_AND_SMART)],
+        bms_kwh_remaining=[ModbusAddressesSpec(holding=_addr(38330), models=_H3_PRO_AND_SMART)],
         bms_pwr_limit_discharge=[],
         bms_pwr_limit_charge=[],
     )
@@ -2722,7 +2847,7 @@ def _configuration_entities() -> Iterable[EntityFactory]:
     yield ModbusWorkModeSelectDescription(
         key="work_mode",
         address=[
-            ModbusAddressSpec(input=41000, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41000, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(holding=41000, models=Inv.H1_G1 | Inv.KH_PRE133 | Inv.KH_133),
         ],
         name="Work Mode",
@@ -2732,7 +2857,7 @@ def _configuration_entities() -> Iterable[EntityFactory]:
     yield ModbusWorkModeSelectDescription(
         key="work_mode",
         address=[
-            ModbusAddressSpec(holding=49203, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=49203, models=_H3_PRO_AND_SMART),
         ],
         name="Work Mode",
         options_map={
@@ -2756,194 +2881,194 @@ def _configuration_entities() -> Iterable[EntityFactory]:
     yield ModbusSensorDescription(
         key="max_charge_current",
         addresses=[
-            ModbusAddressesSpec(input=[41007], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(41007), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[41007],
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(41007),
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressesSpec(holding=[46607], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(46607), models=_H3_PRO_AND_SMART),
         ],
         name="Max Charge Current",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
-        validate=[Range(0, 50)],
+        validate=_range(0, 50),
     )
     yield ModbusNumberDescription(
         key="max_charge_current",
         address=[
-            ModbusAddressSpec(input=41007, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41007, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(
                 holding=41007,
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressSpec(holding=46607, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=46607, models=_H3_PRO_AND_SMART),
         ],
         name="Max Charge Current",
-        mode=NumberMode.BOX,
-        device_class=NumberDeviceClass.CURRENT,
+        mode=_MODE_BOX,
+        device_class=_NUMBER_CURRENT,
         native_min_value=0,
         native_max_value=50,
         native_step=0.1,
-        native_unit_of_measurement="A",
+        native_unit_of_measurement=_U_A,
         scale=0.1,
-        validate=[Range(0, 50)],
+        validate=_range(0, 50),
     )
 
     yield ModbusSensorDescription(
         key="max_discharge_current",
         addresses=[
-            ModbusAddressesSpec(input=[41008], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(41008), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[41008],
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(41008),
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressesSpec(holding=[46608], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(46608), models=_H3_PRO_AND_SMART),
         ],
         name="Max Discharge Current",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement="A",
+        device_class=_CURRENT,
+        state_class=_MEASUREMENT,
+        native_unit_of_measurement=_U_A,
         scale=0.1,
-        validate=[Range(0, 50)],
+        validate=_range(0, 50),
     )
     yield ModbusNumberDescription(
         key="max_discharge_current",
         address=[
-            ModbusAddressSpec(input=41008, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41008, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(
                 holding=41008,
                 models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.KH_PRE133 | Inv.KH_133 | Inv.H3_SET & ~Inv.AIO_H3_PRE101,
             ),
-            ModbusAddressSpec(holding=46608, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=46608, models=_H3_PRO_AND_SMART),
         ],
         name="Max Discharge Current",
-        mode=NumberMode.BOX,
-        device_class=NumberDeviceClass.CURRENT,
+        mode=_MODE_BOX,
+        device_class=_NUMBER_CURRENT,
         native_min_value=0,
         native_max_value=50,
         native_step=0.1,
-        native_unit_of_measurement="A",
+        native_unit_of_measurement=_U_A,
         scale=0.1,
-        validate=[Range(0, 50)],
+        validate=_range(0, 50),
     )
 
     # Sensor kept for back compat
     yield ModbusSensorDescription(
         key="min_soc",
         addresses=[
-            ModbusAddressesSpec(input=[41009], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(41009), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[41009],
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(41009),
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressesSpec(holding=[46609], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(46609), models=_H3_PRO_AND_SMART),
         ],
         name="Min SoC",
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_BATTERY,
+        state_class=_MEASUREMENT,
         icon="mdi:battery-arrow-down",
         native_unit_of_measurement="%",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusNumberDescription(
         key="min_soc",
         address=[
-            ModbusAddressSpec(input=41009, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41009, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(
                 holding=41009,
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressSpec(holding=46609, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=46609, models=_H3_PRO_AND_SMART),
         ],
         name="Min SoC",
-        mode=NumberMode.BOX,
+        mode=_MODE_BOX,
         native_min_value=10,
         native_max_value=100,
         native_step=1,
         native_unit_of_measurement="%",
-        device_class=NumberDeviceClass.BATTERY,
+        device_class=_NUMBER_BATTERY,
         icon="mdi:battery-arrow-down",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
 
     # Sensor kept for back compat
     yield ModbusSensorDescription(
         key="max_soc",
         addresses=[
-            ModbusAddressesSpec(input=[41010], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(41010), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[41010],
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(41010),
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressesSpec(holding=[46610], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(46610), models=_H3_PRO_AND_SMART),
         ],
         name="Max SoC",
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_BATTERY,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement="%",
         icon="mdi:battery-arrow-up",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusNumberDescription(
         key="max_soc",
         address=[
-            ModbusAddressSpec(input=41010, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41010, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(
                 holding=41010,
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressSpec(holding=46610, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=46610, models=_H3_PRO_AND_SMART),
         ],
         name="Max SoC",
-        mode=NumberMode.BOX,
+        mode=_MODE_BOX,
         native_min_value=10,
         native_max_value=100,
         native_step=1,
         native_unit_of_measurement="%",
-        device_class=NumberDeviceClass.BATTERY,
+        device_class=_NUMBER_BATTERY,
         icon="mdi:battery-arrow-up",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
 
     # Sensor kept for back compat
     yield ModbusSensorDescription(
         key="min_soc_on_grid",
         addresses=[
-            ModbusAddressesSpec(input=[41011], models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressesSpec(input=_addr(41011), models=_H1_G1_AND_KH_PRE119),
             ModbusAddressesSpec(
-                holding=[41011],
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                holding=_addr(41011),
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressesSpec(holding=[46611], models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressesSpec(holding=_addr(46611), models=_H3_PRO_AND_SMART),
         ],
         name="Min SoC (On Grid)",
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_BATTERY,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement="%",
         icon="mdi:battery-arrow-down",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusNumberDescription(
         key="min_soc_on_grid",
         address=[
-            ModbusAddressSpec(input=41011, models=Inv.H1_G1 | Inv.KH_PRE119),
+            ModbusAddressSpec(input=41011, models=_H1_G1_AND_KH_PRE119),
             ModbusAddressSpec(
                 holding=41011,
-                models=Inv.H1_G1 | Inv.H1_G2_SET | Inv.H3_SET & ~Inv.AIO_H3_PRE101 | Inv.KH_PRE133 | Inv.KH_133,
+                models=_H1_G1_G2_H3_AND_KH_POST101_AIO,
             ),
-            ModbusAddressSpec(holding=46611, models=Inv.H3_PRO_SET | Inv.H3_SMART),
+            ModbusAddressSpec(holding=46611, models=_H3_PRO_AND_SMART),
         ],
         name="Min SoC (On Grid)",
-        mode=NumberMode.BOX,
+        mode=_MODE_BOX,
         native_min_value=10,
         native_max_value=100,
         native_step=1,
         native_unit_of_measurement="%",
-        device_class=NumberDeviceClass.BATTERY,
+        device_class=_NUMBER_BATTERY,
         icon="mdi:battery-arrow-down",
-        validate=[Range(0, 100)],
+        validate=_RANGE_0_100,
     )
     yield ModbusNumberDescription(
         key="export_limit",
@@ -2952,8 +3077,8 @@ def _configuration_entities() -> Iterable[EntityFactory]:
         ],
         name="Export Limit",
         native_max_value=100000,
-        mode=NumberMode.BOX,
-        device_class=NumberDeviceClass.POWER,
+        mode=_MODE_BOX,
+        device_class=_NUMBER_POWER,
         native_min_value=0,
         native_step=1,
         native_unit_of_measurement="W",
@@ -2961,17 +3086,49 @@ def _configuration_entities() -> Iterable[EntityFactory]:
     )
 
 
-ENTITIES: list[EntityFactory] = sorted(
-    itertools.chain(
-        _version_entities(),
-        _pv_entities(),
-        _h1_current_voltage_power_entities(),
-        _h3_current_voltage_power_entities(),
-        _inverter_entities(),
-        _bms_entities(),
-        _configuration_entities(),
-        (description for x in CHARGE_PERIODS for description in x.entity_descriptions),
-        REMOTE_CONTROL_DESCRIPTION.entity_descriptions,
-    ),
-    key=lambda x: x.depends_on_other_entities,
+# Each group is materialized exactly once at import: anything iterating descriptions gets the same
+# tuple objects rather than re-running the generator bodies (and re-allocating every description)
+_VERSION_ENTITIES = tuple(_version_entities())
+_PV_ENTITIES = tuple(_pv_entities())
+_H1_CURRENT_VOLTAGE_POWER_ENTITIES = tuple(_h1_current_voltage_power_entities())
+_H3_CURRENT_VOLTAGE_POWER_ENTITIES = tuple(_h3_current_voltage_power_entities())
+_INVERTER_ENTITIES = tuple(_inverter_entities())
+_BMS_ENTITIES = tuple(_bms_entities())
+_CONFIGURATION_ENTITIES = tuple(_configuration_entities())
+_CHARGE_PERIOD_ENTITIES = tuple(description for x in CHARGE_PERIODS for description in x.entity_descriptions)
+
+ENTITIES: tuple[EntityFactory, ...] = tuple(
+    sorted(
+        itertools.chain(
+            _VERSION_ENTITIES,
+            _PV_ENTITIES,
+            _H1_CURRENT_VOLTAGE_POWER_ENTITIES,
+            _H3_CURRENT_VOLTAGE_POWER_ENTITIES,
+            _INVERTER_ENTITIES,
+            _BMS_ENTITIES,
+            _CONFIGURATION_ENTITIES,
+            _CHARGE_PERIOD_ENTITIES,
+            REMOTE_CONTROL_DESCRIPTION.entity_descriptions,
+        ),
+        key=lambda x: x.depends_on_other_entities,
+    )
 )
+
+
+@lru_cache(maxsize=None)
+def entity_factories_for(
+    entity_type: type[Entity], inverter_model: Inv, register_type: RegisterType
+) -> tuple[EntityFactory, ...]:
+    """
+    Return the subset of ENTITIES of the given type which support the given model/register type.
+
+    Every platform's setup scans all of ENTITIES and discards the factories which don't apply; the
+    result only depends on (entity type, model, register type), so it's computed once per
+    combination and re-served on reloads. Order (and therefore the depends_on_other_entities sort)
+    is preserved.
+    """
+    return tuple(
+        entity_factory
+        for entity_factory in ENTITIES
+        if entity_factory.entity_type == entity_type and entity_factory.is_supported(inverter_model, register_type)
+    )
@@ -2,6 +2,8 @@
 
 from abc import ABC
 from abc import abstractmethod
+from dataclasses import fields
+from functools import lru_cache
 from typing import Any
 from typing import Sequence
 
@@ -25,12 +27,46 @@ class EntityFactoryMetaclass(FrozenOrThawed, type(ABC)):  # type: ignore
     """
 
 
-ENTITY_DESCRIPTION_KWARGS = {"frozen": True}
+@lru_cache(maxsize=None)
+def _matching_addresses(
+    address_specs: tuple[InverterModelSpec, ...],
+    inverter_model: Inv,
+    register_type: RegisterType,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Resolve which of the given specs match the given inverter model and register type.
+
+    Each description is asked about the same (model, register type) combination once per platform
+    setup, per reload, and again when serialized; the answer only depends on the arguments, so it's
+    resolved once and cached. The specs themselves are shared between descriptions (see
+    inverter_model_spec), so the cache stays small.
+    """
+    return tuple(
+        tuple(addresses)
+        for spec in address_specs
+        if (addresses := spec.addresses_for_inverter_model(register_type=register_type, models=inverter_model))
+        is not None
+    )
+
+
+# slots=True trims per-instance memory (no per-field __dict__ entries) and makes field access a
+# slot-descriptor load; with the number of descriptions defined file-wide this adds up
+ENTITY_DESCRIPTION_KWARGS = {"frozen": True, "slots": True}
 
 
 class EntityFactory(ABC, metaclass=EntityFactoryMetaclass):  # type: ignore
     """Factory which can create entities"""
 
+    def __post_init__(self) -> None:
+        # Freeze list-typed fields to tuples, so that descriptions whose other fields are hashable
+        # can be hashed (and so deduplicated/grouped via sets and dicts in O(1)). Shared
+        # module-level constants are already tuples and pass through untouched, preserving their
+        # sharing; this only snapshots the one-off per-description lists.
+        for field in fields(self):  # type: ignore[arg-type]
+            value = getattr(self, field.name)
+            if type(value) is list:
+                object.__setattr__(self, field.name, tuple(value))
+
     @property
     @abstractmethod
     def entity_type(self) -> type[Entity]:
@@ -54,6 +90,15 @@ class EntityFactory(ABC, metaclass=EntityFactoryMetaclass):  # type: ignore
     def serialize(self, inverter_model: Inv, register_type: RegisterType) -> dict[str, Any] | None:
         """Serialize to a dict, used for snapshot testing."""
 
+    def is_supported(self, inverter_model: Inv, register_type: RegisterType) -> bool:
+        """
+        Whether this factory creates an entity for the given inverter model and register type.
+
+        serialize returns None exactly when the factory doesn't apply, so it doubles as the default
+        probe; factories which don't serialize (and so always return None there) must override this.
+        """
+        return self.serialize(inverter_model, register_type) is not None
+
     def _supports_inverter_model(
         self,
         address_specs: Sequence[InverterModelSpec],
@@ -62,14 +107,10 @@ class EntityFactory(ABC, metaclass=EntityFactoryMetaclass):  # type: ignore
     ) -> bool:
         """Helper to determine whether this entity description supports the given inverter model and register type"""
 
-        result = False
-        for spec in address_specs:
-            addresses = spec.addresses_for_inverter_model(register_type=register_type, models=inverter_model)
-            if addresses is not None:
-                # We shouldn't get more than one spec which matches
-                assert not result, f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
-                result = True
-        return result
+        matches = _matching_addresses(tuple(address_specs), inverter_model, register_type)
+        # We shouldn't get more than one spec which matches
+        assert len(matches) <= 1, f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
+        return len(matches) > 0
 
     def _address_for_inverter_model(
         self,
@@ -86,17 +127,13 @@ class EntityFactory(ABC, metaclass=EntityFactoryMetaclass):  # type: ignore
         matches.
         """
 
-        result: int | None = None
-        for spec in address_specs:
-            addresses = spec.addresses_for_inverter_model(register_type=register_type, models=inverter_model)
-            if addresses is not None:
-                assert len(addresses) == 1, f"{self}: != 1 addresses defined for ({inverter_model}, {register_type})"
-                # We shouldn't get more than one spec which matches
-                assert result is None, (
-                    f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
-                )
-                result = addresses[0]
-        return result
+        matches = _matching_addresses(tuple(address_specs), inverter_model, register_type)
+        if not matches:
+            return None
+        # We shouldn't get more than one spec which matches
+        assert len(matches) == 1, f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
+        assert len(matches[0]) == 1, f"{self}: != 1 addresses defined for ({inverter_model}, {register_type})"
+        return matches[0][0]
 
     def _addresses_for_inverter_model(
         self,
@@ -111,13 +148,10 @@ class EntityFactory(ABC, metaclass=EntityFactoryMetaclass):  # type: ignore
         This will assert if more than one member in address_specs matches.
         """
 
-        result: list[int] | None = None
-        for spec in address_specs:
-            addresses = spec.addresses_for_inverter_model(register_type=register_type, models=inverter_model)
-            if addresses is not None:
-                # We shouldn't get more than one spec which matches
-                assert result is None, (
-                    f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
-                )
-                result = addresses
-        return result
+        matches = _matching_addresses(tuple(address_specs), inverter_model, register_type)
+        if not matches:
+            return None
+        # We shouldn't get more than one spec which matches
+        assert len(matches) == 1, f"{self}: more than one address spec defined for ({inverter_model}, {register_type})"
+        # Callers keep (and occasionally mutate) the result, so give each a fresh list
+        return list(matches[0])
@@ -2,11 +2,25 @@
 
 from abc import ABC
 from abc import abstractmethod
+from array import array
+from functools import lru_cache
+from typing import ClassVar
 
 from ..common.types import Inv
 from ..common.types import RegisterType
 
 
+@lru_cache(maxsize=None)
+def _pack_addresses(addresses: tuple[int, ...]) -> "array[int]":
+    """
+    Pack an address list into a shared array of uint16.
+
+    Register addresses all fit in 16 bits, so packed storage is 2 bytes per address rather than a
+    pointer to a boxed int, and the cache means specs with the same addresses share one array.
+    """
+    return array("H", addresses)
+
+
 class InverterModelSpec(ABC):
     """Base class for specifications which describe which inverter models an entity supports"""
 
@@ -36,23 +50,51 @@ class ModbusAddressSpecBase(InverterModelSpec):
     """
 
     def __init__(self, addresses: dict[RegisterType, list[int] | None], models: Inv) -> None:
-        self._addresses = addresses
+        # The subclasses' __new__ may have handed back an interned instance, which is already set up
+        if hasattr(self, "_models"):
+            return
+        # Addresses are stored packed (see _pack_addresses), and unpacked into lists on access:
+        # specs are only consulted when entities are created/serialized, not on the poll path
+        self._addresses: dict[RegisterType, "array[int] | None"] = {
+            register_type: None if addresses_list is None else _pack_addresses(tuple(addresses_list))
+            for register_type, addresses_list in addresses.items()
+        }
         self._models = models
 
     def address_type_map_for_inverter_model(self, models: Inv) -> dict[RegisterType, list[int] | None]:
         if models not in self._models:
             return {}
-        return self._addresses
+        return {
+            register_type: None if packed is None else list(packed) for register_type, packed in self._addresses.items()
+        }
 
     def addresses_for_inverter_model(self, *, register_type: RegisterType, models: Inv) -> list[int] | None:
         if models not in self._models:
             return None
-        return self._addresses.get(register_type)
+        packed = self._addresses.get(register_type)
+        return None if packed is None else list(packed)
 
 
 class ModbusAddressSpec(ModbusAddressSpecBase):
     """InverterModelSpec for entities which rely on a single modbus register"""
 
+    # Lots of descriptions list identical specs (same registers, same models). Intern them, so all
+    # of those share a single instance rather than each allocating their own
+    _interned: ClassVar[dict[tuple[int | None, int | None, Inv], "ModbusAddressSpec"]] = {}
+
+    def __new__(
+        cls,
+        *,
+        input: int | None = None,  # noqa: A002
+        holding: int | None = None,
+        models: Inv,
+    ) -> "ModbusAddressSpec":
+        key = (input, holding, models)
+        instance = cls._interned.get(key)
+        if instance is None:
+            instance = cls._interned[key] = super().__new__(cls)
+        return instance
+
     def __init__(
         self,
         *,
@@ -71,6 +113,25 @@ class ModbusAddressSpec(ModbusAddressSpecBase):
 class ModbusAddressesSpec(ModbusAddressSpecBase):
     """InverterModelSpec for entities which rely on one or more modbus registers"""
 
+    _interned: ClassVar[dict[tuple[tuple[int, ...] | None, tuple[int, ...] | None, Inv], "ModbusAddressesSpec"]] = {}
+
+    def __new__(
+        cls,
+        *,
+        input: list[int] | None = None,  # noqa: A002
+        holding: list[int] | None = None,
+        models: Inv,
+    ) -> "ModbusAddressesSpec":
+        key = (
+            None if input is None else tuple(input),
+            None if holding is None else tuple(holding),
+            models,
+        )
+        instance = cls._interned.get(key)
+        if instance is None:
+            instance = cls._interned[key] = super().__new__(cls)
+        return instance
+
     def __init__(
         self,
         *,
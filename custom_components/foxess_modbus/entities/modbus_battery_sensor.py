@@ -5,6 +5,7 @@ register
 
 from dataclasses import dataclass
 from typing import Any
+from typing import Sequence
 
 from homeassistant.helpers.entity import Entity
 
@@ -21,7 +22,7 @@ from .modbus_sensor import ModbusSensorDescription
 class ModbusBatterySensorDescription(ModbusSensorDescription):  # type: ignore[misc]
     """Description for ModbusBatterySensor"""
 
-    bms_connect_state_address: list[ModbusAddressSpec]
+    bms_connect_state_address: Sequence[ModbusAddressSpec]
 
     def create_entity_if_supported(
         self,
@@ -2,9 +2,9 @@
 
 import logging
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Any
 from typing import Callable
+from typing import Sequence
 from typing import cast
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
@@ -29,7 +29,7 @@ class ModbusBinarySensorDescription(BinarySensorEntityDescription, EntityFactory
     """Description for ModbusBinarySensor"""
 
     address: list[InverterModelSpec]
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
     icon_func: Callable[[bool | None], str | None] | None
 
     @property
@@ -2,12 +2,12 @@
 
 import logging
 from dataclasses import dataclass
-from dataclasses import field
 from datetime import date
 from datetime import datetime
 from datetime import time
 from decimal import Decimal
 from typing import Any
+from typing import Sequence
 from typing import cast
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -65,7 +65,7 @@ class ModbusChargePeriodStartEndSensorDescription(SensorEntityDescription, Entit
     address: list[InverterModelSpec]
     # Address of period end if this is the start, and vice versa
     other_address: list[InverterModelSpec]
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
 
     @property
     def entity_type(self) -> type[Entity]:
@@ -196,7 +196,7 @@ class ModbusEnableForceChargeSensorDescription(BinarySensorEntityDescription, En
 
     period_start_address: list[InverterModelSpec]
     period_end_address: list[InverterModelSpec]
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
 
     @property
     def entity_type(self) -> type[Entity]:
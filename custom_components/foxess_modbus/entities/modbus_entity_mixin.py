@@ -1,9 +1,11 @@
 """Mixin providing common functionality for all entity classes"""
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Protocol
+from typing import Sequence
 from typing import cast
 
 from homeassistant.const import Platform
@@ -46,16 +48,25 @@ def get_entity_id(controller: EntityController, platform: Platform, key: str) ->
 
 def _add_entity_id_prefix(key: str, inv_details: dict[str, Any]) -> str:
     """Add the entity ID prefix to the beginning of the given input string"""
-    entity_id_prefix = inv_details[ENTITY_ID_PREFIX]
+    return _prefixed_key(inv_details[ENTITY_ID_PREFIX], key)
 
-    if entity_id_prefix:
-        key = f"{entity_id_prefix}_{key}"
 
-    return key
+def _create_unique_id(key: str, inv_details: dict[str, Any]) -> str:
+    return _make_unique_id(inv_details[UNIQUE_ID_PREFIX], key)
 
 
-def _create_unique_id(key: str, inv_details: dict[str, Any]) -> str:
-    unique_id_prefix = inv_details[UNIQUE_ID_PREFIX]
+# Every entity builds these strings on construction, and again on every reload; the inputs are a
+# handful of prefixes crossed with the description keys, so memoizing makes repeat setups serve
+# the same string objects rather than re-formatting them
+
+
+@lru_cache(maxsize=None)
+def _prefixed_key(entity_id_prefix: str, key: str) -> str:
+    return f"{entity_id_prefix}_{key}" if entity_id_prefix else key
+
+
+@lru_cache(maxsize=None)
+def _make_unique_id(unique_id_prefix: str, key: str) -> str:
     if unique_id_prefix:
         key = f"{unique_id_prefix}_{key}"
 
@@ -63,6 +74,11 @@ def _create_unique_id(key: str, inv_details: dict[str, Any]) -> str:
     return "foxess_modbus_" + key
 
 
+@lru_cache(maxsize=None)
+def _make_entity_id(platform: Platform, entity_id_prefix: str, key: str) -> str:
+    return f"{platform}.{_prefixed_key(entity_id_prefix, key)}"
+
+
 class ModbusEntityProtocol(Protocol):
     """Protocol which types including ModbusEntityMixin must implement"""
 
@@ -150,11 +166,13 @@ class ModbusEntityMixin(
 
     def _get_entity_id(self, platform: Platform) -> str:
         """Gets the entity ID"""
-        return f"{platform}.{_add_entity_id_prefix(self.entity_description.key, self._controller.inverter_details)}"
+        return _make_entity_id(
+            platform, self._controller.inverter_details[ENTITY_ID_PREFIX], self.entity_description.key
+        )
 
     def _validate(
         self,
-        rules: list[BaseValidator],
+        rules: Sequence[BaseValidator],
         processed: float,
         original: float | None = None,
         address_override: int | None = None,
@@ -278,6 +278,13 @@ class ModbusFaultSensor(ModbusEntityMixin, SensorEntity):
         self._controller = controller
         self.entity_description = entity_description
         self._addresses = addresses
+        # Precompute (bit mask, fault) pairs per register, leaving out unused bits: decoding a
+        # non-zero register then only tests the bits which mean something, with the shifts done
+        # once here
+        self._fault_bits = [
+            [(1 << index, fault_code) for index, fault_code in enumerate(fault_codes) if fault_code is not None]
+            for fault_codes in entity_description.fault_set.faults
+        ]
         self.entity_id = self._get_entity_id(Platform.SENSOR)
 
     @property
@@ -291,8 +298,8 @@ class ModbusFaultSensor(ModbusEntityMixin, SensorEntity):
             if value is None:
                 return None
             if value != 0:
-                for index, fault_code in enumerate(fault_set.faults[i]):
-                    if fault_code is not None and (value & (1 << index)) > 0:
+                for bit, fault_code in self._fault_bits[i]:
+                    if value & bit:
                         faults.append(fault_code)
 
         if len(faults) == 0:
@@ -1,8 +1,9 @@
 """Select"""
 
 import logging
-from dataclasses import dataclass, field
-from typing import Any, Callable, cast, List
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.const import Platform
@@ -26,7 +27,7 @@ class ModbusNumberDescription(NumberEntityDescription, EntityFactory):  # type:
     mode: NumberMode = NumberMode.AUTO
     scale: float | None = None
     post_process: Callable[[float], float] | None = None
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
 
     @property
     def entity_type(self) -> type[Entity]:
@@ -64,66 +65,93 @@ class ModbusNumber(ModbusEntityMixin, NumberEntity):
         self,
         controller: EntityController,
         entity_description: ModbusNumberDescription,
-        addresses: int | List[int],
+        addresses: list[int],
     ) -> None:
         """Initialize the sensor."""
         self._controller = controller
         self.entity_description = entity_description
-        self._addresses = [addresses] if isinstance(addresses, int) else list(addresses)
+        self._addresses = addresses
+        # The description never changes, so pull the fields used on every read/write out once here
+        # rather than re-casting and re-fetching them per call
+        self._inv_scale = 1.0 / entity_description.scale if entity_description.scale is not None else None
+        # Bake scale/post_process into a single closure (or None if neither applies), so
+        # native_value doesn't re-test which of them is set on every read
+        scale = entity_description.scale
+        post_process = entity_description.post_process
+        self._transform: Callable[[float], float] | None
+        if scale is not None and post_process is not None:
+            self._transform = lambda value: post_process(float(value * scale))
+        elif scale is not None:
+            self._transform = lambda value: value * scale
+        elif post_process is not None:
+            self._transform = lambda value: post_process(float(value))
+        else:
+            self._transform = None
+        self._validators = entity_description.validate
+        # Collapse interval validators into plain bounds checked inline in native_value, instead of
+        # dispatching through validator objects per read (see ModbusSensor._build_decoder). The
+        # validator path is still taken when the inline check fails, so the warning is unchanged
+        lower = -math.inf
+        upper = math.inf
+        inline_bounds = len(self._validators) > 0
+        for rule in self._validators:
+            rule_bounds = rule.bounds()
+            if rule_bounds is None:
+                inline_bounds = False
+                break
+            lower = max(lower, rule_bounds[0])
+            upper = min(upper, rule_bounds[1])
+        self._bounds = (lower, upper) if inline_bounds else None
+        # Clamping only applies when the description sets both bounds; decide that once here
+        min_value = entity_description.native_min_value
+        max_value = entity_description.native_max_value
+        self._clamp: Callable[[float], float] | None
+        if min_value is not None and max_value is not None:
+            self._clamp = lambda value: max(min_value, min(max_value, value))
+        else:
+            self._clamp = None
+        self._attr_mode = entity_description.mode
         self.entity_id = self._get_entity_id(Platform.NUMBER)
 
     @property
     def native_value(self) -> int | float | None:
-        desc = cast(ModbusNumberDescription, self.entity_description)
-
-        # Read value(s)
-        values = self._controller.read(self._addresses, signed=False)
-        if values is None:
+        # The controller combines multi-register values for us (little-endian), so this is already
+        # a single int whether we span one register or several
+        value: int | float | None = self._controller.read(self._addresses, signed=False)
+        if value is None:
             return None
 
-        # Normalize to list
-        if isinstance(values, int):
-            values = [values]
-
-        # Combine little-endian
-        value = sum((v & 0xFFFF) << (16 * i) for i, v in enumerate(values))
         original = value
 
         # Apply scale and post-processing
-        if desc.scale is not None:
-            value *= desc.scale
-        if desc.post_process is not None:
-            value = desc.post_process(float(value))
-
-        if not self._validate(desc.validate, value, original):
+        if self._transform is not None:
+            value = self._transform(value)
+
+        if self._bounds is not None:
+            lower, upper = self._bounds
+            if not lower <= value <= upper:
+                self._validate(self._validators, value, original)
+                return None
+        elif self._validators and not self._validate(self._validators, value, original):
             return None
 
         return value
 
-    @property
-    def mode(self) -> NumberMode:
-        return cast(ModbusNumberDescription, self.entity_description).mode
-
     async def async_set_native_value(self, value: float) -> None:
-        desc = cast(ModbusNumberDescription, self.entity_description)
-
         # Clamp to min/max
-        if desc.native_min_value is not None and desc.native_max_value is not None:
-            value = max(desc.native_min_value, min(desc.native_max_value, value))
+        if self._clamp is not None:
+            value = self._clamp(value)
 
         # Apply inverse scale
-        if desc.scale is not None:
-            value = value / desc.scale
+        if self._inv_scale is not None:
+            value = value * self._inv_scale
 
         int_value = int(round(value))
 
-        # Write single or multiple registers (little-endian)
-        if len(self._addresses) == 1:
-            await self._controller.write_register(self._addresses[0], int_value)
-        else:
-            # Split into 16-bit words little-endian
-            words = [(int_value >> (16 * i)) & 0xFFFF for i in range(len(self._addresses))]
-            await self._controller.write_registers(self._addresses[0], words)
+        # Split into 16-bit words little-endian. write_register is just a single-value wrapper
+        # around write_registers, so there's no need to branch on the address count here
+        words = [(int_value >> (16 * i)) & 0xFFFF for i in range(len(self._addresses))]
+        await self._controller.write_registers(self._addresses[0], words)
 
     @property
     def addresses(self) -> list[int]:
@@ -54,6 +54,10 @@ class ModbusRemoteControlNumberDescription(NumberEntityDescription, EntityFactor
     def serialize(self, _inverter_model: Inv, _register_type: RegisterType) -> dict[str, Any] | None:
         return None
 
+    def is_supported(self, inverter_model: Inv, register_type: RegisterType) -> bool:
+        # We don't serialize, so the default serialize-based probe would always say no
+        return self._supports_inverter_model(self.models, inverter_model, register_type)
+
 
 class ModbusRemoteControlNumber(ModbusEntityMixin, RestoreNumber, NumberEntity):
     """Number class"""
@@ -42,6 +42,10 @@ class ModbusRemoteControlSelectDescription(SelectEntityDescription, EntityFactor
     def serialize(self, _inverter_model: Inv, _register_type: RegisterType) -> dict[str, Any] | None:
         return None
 
+    def is_supported(self, inverter_model: Inv, register_type: RegisterType) -> bool:
+        # We don't serialize, so the default serialize-based probe would always say no
+        return self._supports_inverter_model(self.models, inverter_model, register_type)
+
 
 class ModbusRemoteControlSelect(ModbusEntityMixin, SelectEntity):
     def __init__(
@@ -96,6 +100,11 @@ class ModbusRemoteControlSelect(ModbusEntityMixin, SelectEntity):
         await self._manager.set_mode(value)
         self.schedule_update_ha_state()
 
+    @property
+    def update_callback_on_any_change(self) -> bool:
+        # We have no addresses of our own: updates are driven by the manager's mode
+        return True
+
     def update_callback(self, _changed_addresses: set[int]) -> None:
         if self._manager.mode != self._prev_option:
             self.schedule_update_ha_state()
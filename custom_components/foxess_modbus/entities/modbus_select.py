@@ -2,8 +2,8 @@
 
 import logging
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Any
+from typing import Sequence
 from typing import cast
 
 from homeassistant.components.select import SelectEntity
@@ -29,7 +29,7 @@ class ModbusSelectDescription(SelectEntityDescription, EntityFactory):  # type:
 
     address: list[ModbusAddressSpec]
     options_map: dict[int, str]
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
 
     @property
     def entity_type(self) -> type[Entity]:
@@ -1,14 +1,15 @@
 """Sensor"""
 
 import logging
+import math
 from collections import deque
 from dataclasses import dataclass
-from dataclasses import field
 from datetime import date
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 from typing import Callable
+from typing import Sequence
 from typing import cast
 
 from homeassistant.components.sensor import SensorEntity
@@ -34,11 +35,16 @@ _LOGGER = logging.getLogger(__name__)
 class ModbusSensorDescription(SensorEntityDescription, EntityFactory):  # type: ignore[misc]
     """Custom sensor description"""
 
-    addresses: list[ModbusAddressesSpec]
+    addresses: Sequence[ModbusAddressesSpec]
     scale: float | None = None
+    # Fixed-point alternative to scale, for scales which are exact rationals (e.g. scale=0.1 is
+    # scale_num=1, scale_den=10). When set, decode does an exact integer multiply followed by a
+    # single correctly-rounded division, rather than multiplying by an inexact float
+    scale_num: int = 1
+    scale_den: int | None = None
     round_to: float | None = None
     post_process: Callable[[float], float] | None = None
-    validate: list[BaseValidator] = field(default_factory=list)
+    validate: Sequence[BaseValidator] = ()
     signed: bool = True
 
     @property
@@ -88,32 +94,80 @@ class ModbusSensor(ModbusEntityMixin, SensorEntity):
         self.entity_description = entity_description
         self._addresses = addresses
         self._round_to = round_to
+        # Precomputed once so each rounded sample multiplies by the reciprocal rather than dividing
+        self._round_to_recip = 1.0 / round_to if round_to is not None else None
         self._moving_average_filter: deque[float] | None = deque(maxlen=6) if round_to is not None else None
         self.entity_id = self._get_entity_id(Platform.SENSOR)
+        self._decode = self._build_decoder()
 
-    def _calculate_native_value(self) -> int | float | None:
-        """Return the value reported by the sensor."""
-        entity_description = cast(ModbusSensorDescription, self.entity_description)
-        original = self._controller.read(self._addresses, signed=entity_description.signed)
-
-        if original is None:
-            return None
+    def _build_decoder(self) -> Callable[[], int | float | None]:
+        """
+        Bake the decode steps for this sensor into a closure.
 
-        value: float | int = original
+        The decode path runs for every sensor on every poll, and looking the description's fields
+        up through five attribute accesses per sample adds up. Capturing them as closure locals
+        once here turns each into a plain local load, and drops the scale/post_process branches
+        entirely for sensors which don't use them.
+        """
+        entity_description = cast(ModbusSensorDescription, self.entity_description)
+        read = self._controller.read
+        addresses = self._addresses
+        signed = entity_description.signed
+        scale = entity_description.scale
+        scale_num = entity_description.scale_num
+        scale_den = entity_description.scale_den
+        post_process = entity_description.post_process
+        validate = entity_description.validate
+        validate_fn = self._validate
+
+        # Collapse interval validators into plain bounds which the decoder checks inline, instead
+        # of looping over validator objects per sample. The validator path is still taken when the
+        # inline check fails, so the failure warning is unchanged.
+        lower = -math.inf
+        upper = math.inf
+        inline_bounds = len(validate) > 0
+        for rule in validate:
+            rule_bounds = rule.bounds()
+            if rule_bounds is None:
+                inline_bounds = False
+                break
+            lower = max(lower, rule_bounds[0])
+            upper = min(upper, rule_bounds[1])
+
+        def decode() -> int | float | None:
+            original = read(addresses, signed=signed)
+
+            if original is None:
+                return None
+
+            value: float | int = original
+
+            if scale_den is not None:
+                value = value * scale_num / scale_den
+            elif scale is not None:
+                value = value * scale
+            if post_process is not None:
+                value = post_process(float(value))
+            if inline_bounds:
+                if not lower <= value <= upper:
+                    validate_fn(validate, value, original)
+                    return None
+            elif validate and not validate_fn(validate, value, original):
+                return None
+
+            return value
+
+        return decode
 
-        if entity_description.scale is not None:
-            value = value * entity_description.scale
-        if entity_description.post_process is not None:
-            value = entity_description.post_process(float(value))
-        if not self._validate(entity_description.validate, value, original):
-            return None
+    def _calculate_native_value(self) -> int | float | None:
+        """Return the value reported by the sensor."""
+        return self._decode()
 
-        return value
+    def _nearest_multiple(self, value: float) -> float:
+        assert self._round_to is not None and self._round_to_recip is not None
+        return self._round_to * round(value * self._round_to_recip)
 
     def _round_native_value(self, value: StateType | date | datetime | Decimal) -> Any:
-        def nearest_multiple(value: float, round_to: float) -> float:
-            return round_to * round(value / round_to)
-
         # The aim here is to reduce the amount of data send to HA's database:
         # - Filter out small amounts of noise
         # - Still respond quickly if the value changes by a large amount
@@ -145,10 +199,10 @@ class ModbusSensor(ModbusEntityMixin, SensorEntity):
                 average_value = sum(self._moving_average_filter) / len(self._moving_average_filter)
 
                 if self._attr_native_value is None or not isinstance(self._attr_native_value, float):
-                    value = nearest_multiple(value, self._round_to)
+                    value = self._nearest_multiple(value)
                 else:
                     if abs(self._attr_native_value - average_value) >= self._round_to:
-                        value = nearest_multiple(value, self._round_to)
+                        value = self._nearest_multiple(value)
                         for _ in range(self._moving_average_filter.maxlen):
                             self._moving_average_filter.append(value)
                     else:
@@ -156,8 +210,12 @@ class ModbusSensor(ModbusEntityMixin, SensorEntity):
 
         return value
 
-    def update_callback(self, changed_addresses: set[int]) -> None:
+    @property
+    def update_callback_on_any_change(self) -> bool:
         # If we're using rounding and a filter, we need to respond to every update, even if the register hasn't changed
+        return self._round_to is not None
+
+    def update_callback(self, changed_addresses: set[int]) -> None:
         if self._round_to is None:
             super().update_callback(changed_addresses)
         else:
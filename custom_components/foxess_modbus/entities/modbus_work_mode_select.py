@@ -68,6 +68,11 @@ class ModbusWorkModeSelect(ModbusSelect):
         # explicitly
         self.async_schedule_update_ha_state()
 
+    @property
+    def update_callback_on_any_change(self) -> bool:
+        # We watch for remote control mode changes as well as our own addresses
+        return True
+
     def update_callback(self, changed_addresses: set[int]) -> None:
         super().update_callback(changed_addresses)
 
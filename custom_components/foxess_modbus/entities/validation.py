@@ -1,5 +1,7 @@
 """Validation"""
 
+import math
+
 from .base_validator import BaseValidator
 from .modbus_charge_period_sensors import is_time_value_valid
 
@@ -17,6 +19,9 @@ class Range(BaseValidator):
 
         return self._min <= data <= self._max
 
+    def bounds(self) -> tuple[float, float]:
+        return (self._min, self._max)
+
 
 class Min(BaseValidator):
     """Min validator"""
@@ -30,6 +35,9 @@ class Min(BaseValidator):
 
         return data >= self._min
 
+    def bounds(self) -> tuple[float, float]:
+        return (self._min, math.inf)
+
 
 class Max(BaseValidator):
     """Max validator"""
@@ -43,6 +51,9 @@ class Max(BaseValidator):
 
         return data <= self._max
 
+    def bounds(self) -> tuple[float, float]:
+        return (-math.inf, self._max)
+
 
 class Time(BaseValidator):
     """Time validator"""
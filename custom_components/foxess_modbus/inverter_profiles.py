@@ -19,7 +19,7 @@ from .const import INVERTER_BASE
 from .const import INVERTER_CONN
 from .const import INVERTER_VERSION
 from .entities.charge_period_descriptions import CHARGE_PERIODS
-from .entities.entity_descriptions import ENTITIES
+from .entities.entity_descriptions import entity_factories_for
 from .entities.modbus_charge_period_config import ModbusChargePeriodInfo
 from .entities.modbus_remote_control_config import ModbusRemoteControlAddressConfig
 from .entities.remote_control_description import REMOTE_CONTROL_DESCRIPTION
@@ -188,14 +188,13 @@ class InverterModelConnectionTypeProfile:
 
         result = []
 
-        for entity_factory in ENTITIES:
+        # The type/model/register-type filtering is precomputed (and cached across reloads)
+        for entity_factory in entity_factories_for(entity_type, self._get_inv(controller), self.register_type):
             if (
                 filter_depends_on_other_entites is not None
                 and filter_depends_on_other_entites != entity_factory.depends_on_other_entities
             ):
                 continue
-            if entity_factory.entity_type != entity_type:
-                continue
 
             entity = entity_factory.create_entity_if_supported(
                 controller, self._get_inv(controller), self.register_type
@@ -1,4 +1,18 @@
-"""Modbus controller"""
+"""Modbus controller
+
+A note on performance: this integration is bound by Modbus round-trips and by Home Assistant's
+state machine, not by arithmetic. Profiling-informed work should therefore be spent in this order:
+
+1. Fewer/larger Modbus reads (see _create_read_ranges and its cache) and skipping notifications
+   for registers which didn't change (_refresh);
+2. Caching things derived from immutable inputs (entity_factories_for, _matching_addresses, the
+   interned address specs, the memoized entity id strings);
+3. Avoiding allocations on the per-poll path (the baked decode closures, shared tuples on the
+   descriptions).
+
+Instruction-level tricks (vectorisation, JIT-compiling the register combine, etc.) don't pay off
+here: the combine touches at most a few 16-bit words per value, and everything around it is I/O.
+"""
 
 import asyncio
 import logging
@@ -114,6 +128,11 @@ class ModbusController(EntityController, UnloadController):
         """Init"""
         self._hass = hass
         self._update_listeners: set[ModbusControllerEntity] = set()
+        # Index of address -> listeners owning that address, so updates only dispatch to affected
+        # entities. Listeners with update_callback_on_any_change are tracked separately and always
+        # dispatched.
+        self._address_listeners: dict[int, set[ModbusControllerEntity]] = {}
+        self._any_change_listeners: set[ModbusControllerEntity] = set()
         self._data: dict[int, RegisterValue] = {}
         self._client = client
         self._connection_type_profile = connection_type_profile
@@ -128,6 +147,10 @@ class ModbusController(EntityController, UnloadController):
         self._current_connection_error: str | None = None
         # Any ranges of registers which we've detected that we can't read
         self._detected_invalid_ranges = InvalidRegisterRanges()
+        # The read ranges only change when entities (un)register or we detect an invalid register,
+        # so cache them rather than re-deriving them from self._data every poll. Keyed by
+        # is_initial_connection, as that changes which registers are included
+        self._read_ranges_cache: dict[bool, list[tuple[int, int]]] = {}
 
         self._inverter_capacity = connection_type_profile.inverter_model_profile.inverter_capacity(
             self.inverter_details[INVERTER_MODEL]
@@ -183,44 +206,51 @@ class ModbusController(EntityController, UnloadController):
     def inverter_details(self) -> dict[str, Any]:
         return self._inverter_details
 
-    def read(self, address: int | list[int], *, signed: bool) -> int | None:
+    def _read_value(self, address: int, now: float) -> int | None:
         # There can be a delay between writing a register, and actually reading that value back (presumably the delay
         # is on the inverter somewhere). If we've recently written a value, use that value, rather than the latest-read
         # value
-        now = time.monotonic()
-
-        def _read_value(address: int) -> int | None:
-            register_value = self._data.get(address)
-            if register_value is None:
-                return None
+        register_value = self._data.get(address)
+        if register_value is None:
+            return None
+
+        value: int | None
+        if (
+            register_value.written_value is not None
+            and register_value.written_at is not None
+            and now - register_value.written_at < _INVERTER_WRITE_DELAY_SECS
+        ):
+            value = register_value.written_value
+        else:
+            value = register_value.read_value
 
-            value: int | None
-            if (
-                register_value.written_value is not None
-                and register_value.written_at is not None
-                and now - register_value.written_at < _INVERTER_WRITE_DELAY_SECS
-            ):
-                value = register_value.written_value
-            else:
-                value = register_value.read_value
+        return value
 
-            return value
+    def read(self, address: int | list[int], *, signed: bool) -> int | None:
+        now = time.monotonic()
 
+        # Most entities read a single register; skip the combining loop for those
         if isinstance(address, int):
-            address = [address]
+            value = self._read_value(address, now)
+            if value is None:
+                return None
+            value &= 0xFFFF
+            if signed:
+                value = (value & 0x7FFF) - (value & 0x8000)
+            return value
 
-        value = 0
+        combined = 0
         for i, a in enumerate(address):
-            val = _read_value(a)
+            val = self._read_value(a, now)
             if val is None:
                 return None
-            value |= (val & 0xFFFF) << (i * 16)
+            combined |= (val & 0xFFFF) << (i * 16)
 
         if signed:
             sign_bit = 1 << (len(address) * 16 - 1)
-            value = (value & (sign_bit - 1)) - (value & sign_bit)
+            combined = (combined & (sign_bit - 1)) - (combined & sign_bit)
 
-        return value
+        return combined
 
     async def read_registers(self, start_address: int, num_registers: int, register_type: RegisterType) -> list[int]:
         """Read one of more registers, used by the read_registers_service"""
@@ -287,14 +317,27 @@ class ModbusController(EntityController, UnloadController):
                 # This avoids recording reads if poll failed partway through (ensuring that we don't record potentially
                 # inconsistent data)
                 changed_addresses = set()
+                now = time.monotonic()
                 for start_address, reads in read_values:
                     for i, value in enumerate(reads):
                         address = start_address + i
                         # We might be reading a register we don't care about (for efficiency). Discard it if so
                         register_value = self._data.get(address)
                         if register_value is not None:
-                            register_value.read_value = value
-                            changed_addresses.add(address)
+                            # Most registers don't change between polls. Only tell the entities about the ones
+                            # which did, so unchanged registers skip the decode and HA state update entirely.
+                            # (Entities which need a callback every poll opt in via update_callback_on_any_change.)
+                            if register_value.read_value != value:
+                                register_value.read_value = value
+                                changed_addresses.add(address)
+                            elif register_value.written_at is not None:
+                                # A recent write is still shadowing this register in read(). Keep notifying until
+                                # the shadow expires, so entities settle back to the read value even if the write
+                                # never shows up in it
+                                if now - register_value.written_at >= _INVERTER_WRITE_DELAY_SECS:
+                                    register_value.written_value = None
+                                    register_value.written_at = None
+                                changed_addresses.add(address)
 
                 _LOGGER.debug(
                     "Refresh of %s %s complete - notifying sensors: %s",
@@ -429,7 +472,6 @@ class ModbusController(EntityController, UnloadController):
 
         start_address: int | None = None
         read_size = 0
-        # TODO: Do we want to cache the result of this?
         for address, register_value in sorted(self._data.items()):
             if register_value.poll_type == RegisterPollType.ON_CONNECTION and not is_initial_connection:
                 continue
@@ -479,9 +521,11 @@ class ModbusController(EntityController, UnloadController):
 
         read_values: list[tuple[int, Iterable[int | None]]] = []
 
-        read_ranges = self._create_read_ranges(
-            self._max_read, is_initial_connection=self._connection_state != ConnectionState.CONNECTED
-        )
+        is_initial_connection = self._connection_state != ConnectionState.CONNECTED
+        read_ranges = self._read_ranges_cache.get(is_initial_connection)
+        if read_ranges is None:
+            read_ranges = list(self._create_read_ranges(self._max_read, is_initial_connection=is_initial_connection))
+            self._read_ranges_cache[is_initial_connection] = read_ranges
         for start_address, num_reads in read_ranges:
             _LOGGER.debug(
                 "Reading addresses on %s %s: (%s, %s)",
@@ -537,6 +581,7 @@ class ModbusController(EntityController, UnloadController):
                             address,
                         )
                         self._detected_invalid_ranges.add(address)
+                        self._read_ranges_cache.clear()
                         # Record None at this address, so the sensor gets an 'Unavailable' value
                         read_values.append((address, [None]))
 
@@ -544,28 +589,46 @@ class ModbusController(EntityController, UnloadController):
 
     def register_modbus_entity(self, listener: ModbusControllerEntity) -> None:
         self._update_listeners.add(listener)
+        if listener.update_callback_on_any_change:
+            self._any_change_listeners.add(listener)
         for address in listener.addresses:
             assert not self._connection_type_profile.overlaps_invalid_range(address, address), (
                 f"Entity {listener} address {address} overlaps an invalid range in "
                 f"{self._connection_type_profile.special_registers.invalid_register_ranges}"
             )
+            self._address_listeners.setdefault(address, set()).add(listener)
             if address not in self._data:
                 self._data[address] = RegisterValue(poll_type=listener.register_poll_type)
+                self._read_ranges_cache.clear()
             else:
                 # We could handle this (removing gets harder), but it shouldn't happen in practice anyway
                 assert self._data[address].poll_type == listener.register_poll_type
 
     def remove_modbus_entity(self, listener: ModbusControllerEntity) -> None:
         self._update_listeners.discard(listener)
+        self._any_change_listeners.discard(listener)
         # If this was the only entity listening on this address, remove it from self._data
         other_addresses = {address for entity in self._update_listeners for address in entity.addresses}
         for address in listener.addresses:
+            listeners = self._address_listeners.get(address)
+            if listeners is not None:
+                listeners.discard(listener)
+                if not listeners:
+                    del self._address_listeners[address]
             if address not in other_addresses and address in self._data:
                 del self._data[address]
+                self._read_ranges_cache.clear()
 
     def _notify_update(self, changed_addresses: set[int]) -> None:
         """Notify listeners"""
-        for listener in self._update_listeners:
+        # Dispatch from the address index, so only entities owning a changed address hear about it
+        # (plus those which have asked to hear about everything)
+        affected = set(self._any_change_listeners)
+        for address in changed_addresses:
+            listeners = self._address_listeners.get(address)
+            if listeners is not None:
+                affected.update(listeners)
+        for listener in affected:
             listener.update_callback(changed_addresses)
 
     async def _notify_is_connected_changed(self, is_connected: bool) -> None: